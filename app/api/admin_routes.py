@@ -77,7 +77,7 @@ async def clear_map_prices_cache(request: Request) -> dict:
         Number of keys deleted
     """
     redis_cache = request.app.state.redis_cache
-    deleted = redis_cache.clear_pattern("map_price:*")
+    deleted = await redis_cache.clear_pattern_async("map_price:*")
     return {
         "message": f"Map prices cache cleared successfully",
         "keys_deleted": deleted
@@ -159,7 +159,7 @@ async def clear_invalid_routes(
 
         # Also clear Redis map-price cache (cached None values from blacklisted routes)
         redis_cache = request.app.state.redis_cache
-        redis_deleted = redis_cache.clear_pattern("map_price:*")
+        redis_deleted = await redis_cache.clear_pattern_async("map_price:*")
 
         origin_msg = f" from {body.origin.upper()}" if body.origin else ""
         logger.info(
@@ -192,9 +192,9 @@ async def clear_hotels_cache(request: Request) -> dict:
     redis_cache = request.app.state.redis_cache
 
     # Clear all hotel-related caches
-    hotel_search = redis_cache.clear_pattern("hotel_search:*")
-    hotel_details = redis_cache.clear_pattern("hotel_details:*")
-    hotel_map = redis_cache.clear_pattern("hotel_map_price:*")
+    hotel_search = await redis_cache.clear_pattern_async("hotel_search:*")
+    hotel_details = await redis_cache.clear_pattern_async("hotel_details:*")
+    hotel_map = await redis_cache.clear_pattern_async("hotel_map_price:*")
 
     total = hotel_search + hotel_details + hotel_map
 
@@ -276,6 +276,11 @@ async def sync_destinations(
                 filter_types=sync_request.filter_types
             )
 
+        # Cached city candidates are stale once the collection changed
+        location_resolver = getattr(request.app.state, "location_resolver", None)
+        if location_resolver is not None:
+            location_resolver.invalidate()
+
         return DestinationsSyncResponse(
             success=True,
             message=f"Successfully synced {stats['updated']} destinations from Viator API",
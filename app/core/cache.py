@@ -1,9 +1,10 @@
 """Simple in-memory cache with TTL (Time To Live)."""
 
+import asyncio
 import time
 import hashlib
 import json
-from typing import Callable, Any, Optional
+from typing import Awaitable, Callable, Any, Dict, Hashable, Optional
 from functools import wraps
 
 
@@ -20,25 +21,45 @@ class CacheEntry:
 
 
 class SimpleCache:
-    """Simple in-memory cache with TTL support."""
+    """Simple in-memory cache with TTL support.
 
-    def __init__(self):
+    When ``max_entries`` is set the cache behaves as an LRU: reads move an
+    entry to the back and writes evict the least recently used entry once
+    the cache is full.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
         self._cache = {}
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache if not expired."""
         entry = self._cache.get(key)
         if entry is None:
+            self.misses += 1
             return None
 
         if entry.is_expired():
             del self._cache[key]
+            self.misses += 1
             return None
 
+        if self.max_entries is not None:
+            # Re-insert to mark as most recently used
+            del self._cache[key]
+            self._cache[key] = entry
+
+        self.hits += 1
         return entry.value
 
     def set(self, key: str, value: Any, ttl_seconds: int):
         """Set value in cache with TTL."""
+        self._cache.pop(key, None)
+        if self.max_entries is not None and len(self._cache) >= self.max_entries:
+            # Evict least recently used entry (dicts keep insertion order)
+            del self._cache[next(iter(self._cache))]
         self._cache[key] = CacheEntry(value, ttl_seconds)
 
     def clear(self):
@@ -55,6 +76,99 @@ class SimpleCache:
             del self._cache[key]
 
 
+class SingleFlight:
+    """Collapse concurrent calls that share a key onto one in-flight task.
+
+    The first caller starts the work; callers arriving while it is still
+    running await the same task instead of issuing a duplicate request.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one cancelled caller does not cancel the shared work
+        return await asyncio.shield(task)
+
+
+class LookupCache:
+    """Two-level cache for external API lookups.
+
+    L1 is a bounded in-process LRU, L2 is an optional shared Redis cache
+    (any object exposing RedisCache's
+    ``get_or_set_async(prefix, params, factory, ttl_seconds)``). Only non-None
+    results are cached so that swallowed upstream errors are retried.
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        ttl_seconds: int,
+        redis_cache: Optional[Any] = None,
+        max_entries: int = 4096,
+    ):
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+        self.redis_cache = redis_cache
+        self._memory = SimpleCache(max_entries=max_entries)
+        self._inflight = SingleFlight()
+
+    @property
+    def hits(self) -> int:
+        return self._memory.hits
+
+    @property
+    def misses(self) -> int:
+        return self._memory.misses
+
+    def clear(self) -> None:
+        """Drop the in-process entries (Redis entries expire on their TTL)."""
+        self._memory.clear()
+
+    async def get_or_fetch(
+        self,
+        params: dict,
+        fetch: Callable[[], Awaitable[Optional[Any]]],
+    ) -> Optional[Any]:
+        """Return the cached value for ``params`` or await ``fetch()`` and cache it.
+
+        Args:
+            params: Flat dict of hashable values identifying the lookup
+            fetch: Zero-argument coroutine factory called on a miss
+
+        Returns:
+            Cached or freshly fetched value (None if the fetch found nothing)
+        """
+        key = f"{self.prefix}:{sorted(params.items())}"
+
+        value = self._memory.get(key)
+        if value is not None:
+            return value
+
+        return await self._inflight.run(key, lambda: self._fetch_and_store(key, params, fetch))
+
+    async def _fetch_and_store(
+        self,
+        key: str,
+        params: dict,
+        fetch: Callable[[], Awaitable[Optional[Any]]],
+    ) -> Optional[Any]:
+        if self.redis_cache:
+            value = await self.redis_cache.get_or_set_async(
+                self.prefix, params, fetch, ttl_seconds=self.ttl_seconds
+            )
+        else:
+            value = await fetch()
+        if value is not None:
+            self._memory.set(key, value, self.ttl_seconds)
+        return value
+
+
 # Global cache instance
 _global_cache = SimpleCache()
 
@@ -0,0 +1,100 @@
+"""Circuit breaker for outbound API calls."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose circuit is open."""
+
+    def __init__(self, name: str):
+        super().__init__(f"Circuit '{name}' is open, failing fast")
+        self.name = name
+
+
+class CircuitBreaker:
+    """Fail fast after repeated upstream failures.
+
+    CLOSED: calls go through; ``fail_max`` consecutive failures open the
+    circuit. OPEN: calls raise CircuitOpenError without touching the
+    upstream. After ``reset_timeout`` seconds the circuit is HALF_OPEN and
+    lets a single trial call through: success closes it, failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, fail_max: int = 10, reset_timeout: float = 30.0):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def _allow(self) -> bool:
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def _record_success(self) -> None:
+        if self._opened_at is not None:
+            logger.info(f"Circuit '{self.name}' closed")
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def _record_failure(self) -> None:
+        self._trial_in_flight = False
+        self._failures += 1
+        if self._opened_at is not None or self._failures >= self.fail_max:
+            if self._opened_at is None:
+                logger.warning(
+                    f"Circuit '{self.name}' opened after {self._failures} consecutive failures"
+                )
+            self._opened_at = time.monotonic()
+
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await ``fn()`` through the breaker.
+
+        Any exception raised by ``fn`` counts as a failure, so ``fn`` should
+        only raise for upstream faults (network errors, 5xx).
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        if not self._allow():
+            raise CircuitOpenError(self.name)
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # No verdict: let the next call be the half-open trial
+            self._trial_in_flight = False
+            raise
+        except Exception:
+            self._record_failure()
+            raise
+        self._record_success()
+        return result
@@ -43,6 +43,7 @@ class Settings(BaseSettings):
     viator_api_key_prod: str = Field("", alias="VIATOR_API_KEY_PROD")
     viator_env: str = Field("dev", alias="VIATOR_ENV")
     viator_base_url: str = Field("https://api.viator.com", alias="VIATOR_BASE_URL")
+    viator_max_concurrency: int = Field(50, alias="VIATOR_MAX_CONCURRENCY")
 
     @property
     def viator_api_key(self) -> str:
@@ -82,6 +83,7 @@ class Settings(BaseSettings):
     ttl_days: int = Field(365, description="Days before a POI document is considered stale")
     google_places_daily_cap: int = Field(9500, description="Soft cap to avoid exceeding free Google quotas")
     wikidata_user_agent: str = Field("poi-details-api/1.0", description="User agent used for Wikidata requests")
+    wikidata_max_concurrency: int = Field(5, alias="WIKIDATA_MAX_CONCURRENCY", description="In-flight SPARQL requests (Wikidata allows 5 per IP)")
     default_detail_types: list[str] = Field(default_factory=lambda: ["hours", "pricing", "contact", "facts"])
 
     # Cache TTLs (in seconds)
@@ -0,0 +1,48 @@
+"""Deadline propagation for outbound API calls.
+
+A caller sets a deadline with ``deadline_scope``; every client called from
+within that block (including tasks spawned from it, since context vars are
+copied into new tasks) shrinks its timeouts and skips retries that could
+not finish in time.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+# Absolute deadline on the time.monotonic() clock, None when unbounded
+DEADLINE: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(seconds: float) -> Iterator[None]:
+    """
+    Bound outbound calls made inside the block to ``seconds`` from now.
+
+    Nested scopes never extend an enclosing deadline.
+    """
+    deadline = time.monotonic() + seconds
+    current = DEADLINE.get()
+    if current is not None:
+        deadline = min(deadline, current)
+    token = DEADLINE.set(deadline)
+    try:
+        yield
+    finally:
+        DEADLINE.reset(token)
+
+
+def remaining(default: float = float("inf")) -> float:
+    """Seconds left before the current deadline (``default`` when none is set)."""
+    deadline = DEADLINE.get()
+    if deadline is None:
+        return default
+    return deadline - time.monotonic()
+
+
+def call_timeout(default: float, minimum: float = 0.5) -> float:
+    """Per-call timeout: ``default`` capped to the time left before the deadline."""
+    return max(minimum, min(default, remaining(default)))
@@ -0,0 +1,49 @@
+"""Client-side rate limiting for outbound API calls."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Async token bucket: at most ``rate`` acquisitions per second on average.
+
+    Up to ``capacity`` tokens (default: one second's worth) can be spent in a
+    burst. Waiters are served in arrival order. Use ``async with bucket:``
+    or ``await bucket.acquire()`` before each request.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then take it."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def drain(self) -> None:
+        """Drop any banked tokens (e.g. after the server reports an exhausted quota)."""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0)
+
+    async def __aenter__(self) -> "TokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
@@ -11,6 +11,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import httpx
 
 from app.api.routes import router
@@ -56,7 +57,8 @@ from app.services.destination_suggestions import DestinationSuggestionService
 from app.services.flight_price_cache import FlightPriceCacheService
 
 settings = get_settings()
-app = FastAPI(title=settings.app_name)
+# Responses are serialized with orjson instead of stdlib json
+app = FastAPI(title=settings.app_name, default_response_class=ORJSONResponse)
 
 # Configure CORS
 app.add_middleware(
@@ -77,8 +79,15 @@ async def cleanup_cache_task():
 
 @app.on_event("startup")
 async def startup_event() -> None:
-    app.state.http_client = httpx.AsyncClient(timeout=90.0)
-    logger.info(f"HTTP client initialized with timeout=90s")
+    app.state.http_client = httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(90.0, connect=5.0),
+        # Shared by every upstream client (Viator, Wikidata, Geoapify, ...)
+        limits=httpx.Limits(
+            max_keepalive_connections=50, max_connections=100, keepalive_expiry=30.0
+        ),
+    )
+    logger.info("HTTP client initialized (HTTP/2, timeout=90s, connect=5s)")
 
     # Start background cache cleanup task
     asyncio.create_task(cleanup_cache_task())
@@ -127,11 +136,25 @@ async def startup_event() -> None:
 
     # Initialize POI enrichment services
     repository = POIRepository(app.state.mongo_manager.collection(), ttl_days=settings.ttl_days)
-    google_client = GooglePlacesClient(settings.google_maps_api_key, app.state.http_client, settings.google_places_daily_cap)
+    google_client = GooglePlacesClient(
+        settings.google_maps_api_key,
+        app.state.http_client,
+        settings.google_places_daily_cap,
+        redis_cache=app.state.redis_cache,
+    )
     nominatim_client = NominatimClient(settings.wikidata_user_agent, app.state.http_client)
-    geoapify_client = GeoapifyClient(settings.geoapify_api_key, app.state.http_client)
+    geoapify_client = GeoapifyClient(
+        settings.geoapify_api_key,
+        app.state.http_client,
+        redis_cache=app.state.redis_cache,
+    )
     translation_client = TranslationClient(settings.translation_service_url, app.state.http_client)
-    wikidata_client = WikidataClient(settings.wikidata_user_agent, app.state.http_client)
+    wikidata_client = WikidataClient(
+        settings.wikidata_user_agent,
+        app.state.http_client,
+        max_concurrency=settings.wikidata_max_concurrency,
+        redis_cache=app.state.redis_cache,
+    )
 
     app.state.enrichment_service = EnrichmentService(
         repo=repository,
@@ -149,7 +172,9 @@ async def startup_event() -> None:
         app.state.viator_client = ViatorClient(
             api_key=settings.viator_api_key,
             base_url=settings.viator_base_url,
-            http_client=app.state.http_client
+            http_client=app.state.http_client,
+            redis_cache=app.state.redis_cache,
+            max_concurrency=settings.viator_max_concurrency,
         )
 
         app.state.viator_products = ViatorProductsService(app.state.viator_client)
@@ -189,7 +214,10 @@ async def startup_event() -> None:
         )
 
         # Initialize location resolver
-        app.state.location_resolver = LocationResolver(destinations_collection)
+        app.state.location_resolver = LocationResolver(
+            destinations_collection,
+            redis_cache=app.state.redis_cache,
+        )
 
         # Initialize activities service
         app.state.activities_service = ActivitiesService(
@@ -301,6 +329,7 @@ async def startup_event() -> None:
 async def shutdown_event() -> None:
     client: httpx.AsyncClient = app.state.http_client
     await client.aclose()
+    await app.state.redis_cache.close()
     await app.state.mongo_manager.close()
 
     # Close PostgreSQL if it was initialized
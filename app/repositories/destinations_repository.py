@@ -68,6 +68,11 @@ class DestinationsRepository:
         # Country code
         await self.collection.create_index("country_code")
 
+        # City candidates for LocationResolver (covers its projected query)
+        await self.collection.create_index(
+            [("type", 1), ("country_code", 1), ("name", 1), ("destination_id", 1)]
+        )
+
         # Geospatial
         await self.collection.create_index([("location", "2dsphere")])
 
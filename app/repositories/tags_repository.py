@@ -33,6 +33,34 @@ class TagsRepository:
         else:
             logger.debug(f"Updated existing tag: {tag_id}")
 
+    async def upsert_tags_bulk(self, tags: List[dict], batch_size: int = 1000) -> int:
+        """
+        Upsert many tags with unordered bulk writes.
+
+        Args:
+            tags: Tag documents (each with tag_id)
+            batch_size: Operations per bulk_write call
+
+        Returns:
+            Number of tags written (matched or inserted)
+        """
+        if not tags:
+            return 0
+
+        from pymongo import UpdateOne
+
+        written = 0
+        for start in range(0, len(tags), batch_size):
+            operations = [
+                UpdateOne({"tag_id": tag["tag_id"]}, {"$set": tag}, upsert=True)
+                for tag in tags[start:start + batch_size]
+            ]
+            result = await self.collection.bulk_write(operations, ordered=False)
+            written += result.matched_count + result.upserted_count
+
+        logger.info(f"Bulk upserted {written} tags")
+        return written
+
     async def get_tag(self, tag_id: int) -> Optional[dict]:
         """Get tag by ID."""
         return await self.collection.find_one({"tag_id": tag_id})
@@ -101,7 +101,7 @@ class ActivitiesService:
         cache_key = self._build_cache_key(destination_id, request)
 
         if not force_refresh:
-            cached = self.cache.get("activities_search", {"key": cache_key})
+            cached = await self.cache.get_async("activities_search", {"key": cache_key})
 
             if cached:
                 logger.info(f"Cache HIT for activities search")
@@ -172,10 +172,7 @@ class ActivitiesService:
 
             viator_response = await self._call_viator_search(destination_id, request)
 
-            activities = [
-                ViatorMapper.map_product_summary(product)
-                for product in viator_response.get("products", [])
-            ]
+            activities = ViatorMapper.map_products(viator_response.get("products", []))
             total_count = viator_response.get("totalCount", 0)
 
             # Set type field for consistency
@@ -237,7 +234,7 @@ class ActivitiesService:
             "expires_at": datetime.utcnow().isoformat()  # Compute expiration
         }
 
-        self.cache.set("activities_search", {"key": cache_key}, cache_data, ttl_seconds=self.cache_ttl)
+        await self.cache.set_async("activities_search", {"key": cache_key}, cache_data, ttl_seconds=self.cache_ttl)
 
         return ActivitySearchResponse(
             success=True,
@@ -554,10 +551,7 @@ class ActivitiesService:
                 # Restore original limit
                 request.pagination.limit = original_limit
 
-                activities_raw = [
-                    ViatorMapper.map_product_summary(product)
-                    for product in viator_response.get("products", [])
-                ]
+                activities_raw = ViatorMapper.map_products(viator_response.get("products", []))
 
                 # Add type field
                 for activity in activities_raw:
@@ -624,23 +618,27 @@ class ActivitiesService:
                 first_page = viator_response.get("attractions", [])
                 attractions_all.extend(first_page)
 
-                # Fetch additional pages if needed and available
-                pages_fetched = 1
-                while len(attractions_all) < target_count and len(attractions_all) < total_available and pages_fetched < max_pages:
-                    pages_fetched += 1
-                    start_pos = (pages_fetched - 1) * page_size + 1
-
-                    next_response = await self.viator_attractions.search_attractions(
+                # Fetch the additional pages needed concurrently (total is known
+                # from the first page)
+                wanted = min(target_count, total_available)
+                page_count = min(max_pages, -(-wanted // page_size)) if first_page else 1
+                next_responses = await asyncio.gather(*(
+                    self.viator_attractions.search_attractions(
                         destination_id=destination_id,
                         sort="REVIEW_AVG_RATING",
-                        start=start_pos,
+                        start=page * page_size + 1,
                         count=page_size,
                         language=request.language
                     )
+                    for page in range(1, page_count)
+                ))
 
+                pages_fetched = 1
+                for next_response in next_responses:
                     next_page = next_response.get("attractions", [])
                     if not next_page:
                         break
+                    pages_fetched += 1
                     attractions_all.extend(next_page)
 
                 # Map all attractions to our format
@@ -1026,18 +1024,19 @@ class ActivitiesService:
             language: Language code for tag names
         """
         try:
-            # Step 1: Collect all unique tag IDs from all activities
-            all_tag_ids = set()
+            # Step 1: Collect all unique categories and their tag IDs
+            all_categories = set()
             for activity in activities:
-                categories = activity.get("categories", [])
-                for category in categories:
-                    # Categories are now strings like "367660", parse them
-                    try:
-                        tag_id = int(category)
-                        all_tag_ids.add(tag_id)
-                    except ValueError:
-                        # Skip if not a numeric tag ID (e.g., "attraction")
-                        continue
+                all_categories.update(activity.get("categories", []))
+
+            all_tag_ids = set()
+            for category in all_categories:
+                # Categories are now strings like "367660", parse them
+                try:
+                    all_tag_ids.add(int(category))
+                except ValueError:
+                    # Skip if not a numeric tag ID (e.g., "attraction")
+                    continue
 
             if not all_tag_ids:
                 logger.info("No tag IDs to resolve")
@@ -1050,31 +1049,30 @@ class ActivitiesService:
 
             logger.info(f"Found {len(tags_map)} tags in MongoDB")
 
-            # Step 3: Replace tag IDs with names in each activity
-            for activity in activities:
-                categories = activity.get("categories", [])
-                resolved_categories = []
+            # Step 3: Resolve each distinct category once
+            resolved_names = {}
+            for category in all_categories:
+                try:
+                    tag_id = int(category)
+                except ValueError:
+                    # Not a numeric tag ID (e.g., "attraction"), keep as-is
+                    resolved_names[category] = category
+                    continue
 
-                for category in categories:
-                    try:
-                        tag_id = int(category)
-                        tag_doc = tags_map.get(tag_id)
-
-                        if tag_doc:
-                            # Get name in requested language, fallback to tag_name
-                            tag_name = tag_doc.get("all_names", {}).get(language) or tag_doc.get("tag_name", f"tag_{tag_id}")
-                            resolved_categories.append(tag_name)
-                        else:
-                            # Tag not found in DB, keep as generic
-                            logger.debug(f"Tag {tag_id} not found in MongoDB")
-                            resolved_categories.append(f"tag_{tag_id}")
-
-                    except ValueError:
-                        # Not a numeric tag ID (e.g., "attraction"), keep as-is
-                        resolved_categories.append(category)
-
-                # Replace categories with resolved names
-                activity["categories"] = resolved_categories
+                tag_doc = tags_map.get(tag_id)
+                if tag_doc:
+                    # Get name in requested language, fallback to tag_name
+                    resolved_names[category] = tag_doc.get("all_names", {}).get(language) or tag_doc.get("tag_name", f"tag_{tag_id}")
+                else:
+                    # Tag not found in DB, keep as generic
+                    logger.debug("Tag %s not found in MongoDB", tag_id)
+                    resolved_names[category] = f"tag_{tag_id}"
+
+            # Step 4: Replace tag IDs with names in each activity
+            for activity in activities:
+                activity["categories"] = [
+                    resolved_names[category] for category in activity.get("categories", [])
+                ]
 
             logger.info(f"Tag resolution completed for {len(activities)} activities")
 
@@ -5,6 +5,7 @@ import asyncio
 import logging
 from typing import Optional, Any, List
 import httpx
+import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 logger = logging.getLogger(__name__)
@@ -109,7 +110,7 @@ class BookingClient:
             # Handle other errors
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # RapidAPI sometimes wraps response in 'data' or 'result'
             if isinstance(data, dict):
@@ -156,7 +156,7 @@ class HotelsService:
             return None
         try:
             key = self._generate_cache_key(prefix, params)
-            return self.cache.get(prefix, {"key": key})
+            return await self.cache.get_async(prefix, {"key": key})
         except Exception as e:
             logger.warning(f"Cache get error: {e}")
             return None
@@ -167,7 +167,7 @@ class HotelsService:
             return
         try:
             key = self._generate_cache_key(prefix, params)
-            self.cache.set(prefix, {"key": key}, data, ttl_seconds=ttl_seconds)
+            await self.cache.set_async(prefix, {"key": key}, data, ttl_seconds=ttl_seconds)
         except Exception as e:
             logger.warning(f"Cache set error: {e}")
 
@@ -10,6 +10,7 @@ from collections import defaultdict
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
+from app.core.deadline import deadline_scope
 from app.models.destination_suggestions import (
     BudgetEstimate,
     BudgetLevel,
@@ -90,6 +91,9 @@ class DestinationSuggestionService:
     MAX_PER_REGION = 2  # Max countries from same region in pool
     VARIATION_INTERVAL_HOURS = 1  # Change recommendations every hour
 
+    # Time budget for the LLM batch before falling back to static content
+    LLM_DEADLINE_SECONDS = 20
+
     def __init__(
         self,
         profiles_repo: "CountryProfilesRepository",
@@ -148,7 +152,7 @@ class DestinationSuggestionService:
 
         # Check cache
         if not force_refresh:
-            cached = self.cache.get("dest_suggest", {"key": cache_key})
+            cached = await self.cache.get_async("dest_suggest", {"key": cache_key})
             if cached:
                 logger.info("Cache HIT for destination suggestions")
                 return DestinationSuggestionsResponse(**cached)
@@ -259,7 +263,8 @@ class DestinationSuggestionService:
             }
 
             try:
-                llm_results = await self.llm.generate_batch(llm_input, user_prefs_dict)
+                with deadline_scope(self.LLM_DEADLINE_SECONDS):
+                    llm_results = await self.llm.generate_batch(llm_input, user_prefs_dict)
                 llm_map = {r[0]: (r[1], r[2]) for r in llm_results}
             except Exception as e:
                 logger.error(f"LLM batch generation failed: {e}")
@@ -364,7 +369,7 @@ class DestinationSuggestionService:
 
         # Cache response
         try:
-            self.cache.set(
+            await self.cache.set_async(
                 "dest_suggest",
                 {"key": cache_key},
                 response.model_dump(),
@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Dict, Optional
 from fastapi import HTTPException
 
+from app.core.deadline import deadline_scope
 from app.models.poi import (
     ContactInfo,
     FactsInfo,
@@ -21,6 +22,9 @@ from app.utils.normalization import build_poi_key
 
 
 class EnrichmentService:
+    # Time budget for all provider calls made while enriching one POI
+    DEADLINE_SECONDS = 30
+
     def __init__(
         self,
         repo: POIRepository,
@@ -42,6 +46,10 @@ class EnrichmentService:
         self.default_detail_types = default_detail_types
 
     async def get_poi_details(self, payload: POIRequest) -> POIDocument:
+        with deadline_scope(self.DEADLINE_SECONDS):
+            return await self._get_poi_details(payload)
+
+    async def _get_poi_details(self, payload: POIRequest) -> POIDocument:
         detail_types = payload.detail_types or self.default_detail_types
         detail_types = list(dict.fromkeys(detail_types))
         poi_key = build_poi_key(payload.poi_name, payload.city)
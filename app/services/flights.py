@@ -6,6 +6,7 @@ import logging
 from typing import Optional, TYPE_CHECKING
 from datetime import date, datetime, timedelta
 import httpx
+import orjson
 
 from app.models.flights import (
     FlightSearchRequest,
@@ -143,7 +144,7 @@ class FlightsService:
                     params=params
                 )
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
 
             # Check API response status
             if not data.get("status"):
@@ -424,7 +425,7 @@ class FlightsService:
                     params=params
                 )
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
 
             # Check API response status
             if not data.get("status"):
@@ -484,7 +485,7 @@ class FlightsService:
         Get cheapest flight prices over next 3 months for multiple destinations.
 
         Optimized flow:
-        1. Check cache for ALL destinations first (sync, fast)
+        1. Check cache for ALL destinations first (concurrent, fast)
         2. Only make API calls for uncached destinations (async, parallel)
         3. Merge results
 
@@ -504,13 +505,19 @@ class FlightsService:
         results: dict[str, Optional[dict]] = {}
         to_fetch: list[str] = []
 
-        # Phase 1: Check cache for all destinations (fast, synchronous)
-        for destination in destinations:
-            cache_params = self._build_map_price_cache_key(
-                origin, destination, adults, currency, today, end_date
+        # Phase 1: Check cache for all destinations (concurrent lookups)
+        cached_entries = await asyncio.gather(
+            *(
+                self._redis.get_async(
+                    "map_price",
+                    self._build_map_price_cache_key(
+                        origin, destination, adults, currency, today, end_date
+                    ),
+                )
+                for destination in destinations
             )
-            cached = self._redis.get("map_price", cache_params)
-
+        )
+        for destination, cached in zip(destinations, cached_entries):
             if cached is not None:
                 # Cache hit - add to results immediately
                 results[destination] = cached.get("data")
@@ -556,7 +563,7 @@ class FlightsService:
                         cache_params = self._build_map_price_cache_key(
                             origin, destination, adults, currency, today, end_date
                         )
-                        self._redis.set(
+                        await self._redis.set_async(
                             "map_price",
                             cache_params,
                             {"data": result},
@@ -669,7 +676,7 @@ class FlightsService:
                         logger.error(f"HTTP {response.status_code} for {origin} -> {destination}: {response.text[:300]}")
                         return None
 
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     break  # Success, exit retry loop
 
             except httpx.TimeoutException:
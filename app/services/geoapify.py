@@ -5,9 +5,14 @@ Provides opening hours, contact info, facilities, and more.
 Documentation: https://apidocs.geoapify.com/docs/places/
 """
 from __future__ import annotations
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional
 import httpx
-from datetime import datetime
+import orjson
+
+from app.core.cache import LookupCache, SimpleCache
+from app.core.deadline import call_timeout
+from app.utils.timestamps import utc_now_iso
 
 
 class GeoapifyClient:
@@ -18,7 +23,7 @@ class GeoapifyClient:
     GEOCODE_API_URL = "https://api.geoapify.com/v1/geocode/search"
     
     # Travel-relevant categories from Geoapify documentation
-    TRAVEL_CATEGORIES = {
+    TRAVEL_CATEGORIES = MappingProxyType({
         # Tourism & Attractions
         "tourism": "tourism",
         "attraction": "tourism.attraction",
@@ -76,11 +81,39 @@ class GeoapifyClient:
         # Heritage
         "heritage": "heritage",
         "unesco": "heritage.unesco",
-    }
+    })
+    
+    # Pre-joined defaults (used by the vast majority of calls)
+    DEFAULT_CATEGORIES = "tourism,entertainment,heritage,leisure.park"
+    DEFAULT_DETAIL_FEATURES = "details"
+    
+    # Lookup cache settings; coordinates are rounded to ~11m so nearby
+    # queries for the same POI share an entry
+    CACHE_TTL_SECONDS = 86400
+    CACHE_COORD_PRECISION = 4
+    
+    # Conditional-request validators outlive the lookup cache so expired
+    # entries are revalidated (If-None-Match) rather than re-downloaded
+    VALIDATOR_TTL_SECONDS = 30 * 86400
     
-    def __init__(self, api_key: str, http_client: httpx.AsyncClient):
+    __slots__ = (
+        "api_key",
+        "http",
+        "_default_headers",
+        "_places_cache",
+        "_geocode_cache",
+        "_details_cache",
+        "_validators",
+    )
+    
+    def __init__(self, api_key: str, http_client: httpx.AsyncClient, redis_cache: Optional[Any] = None):
         self.api_key = api_key
         self.http = http_client or httpx.AsyncClient()
+        self._default_headers = {"Accept": "application/json"}
+        self._places_cache = LookupCache("geoapify_places", self.CACHE_TTL_SECONDS, redis_cache)
+        self._geocode_cache = LookupCache("geoapify_geocode", self.CACHE_TTL_SECONDS, redis_cache)
+        self._details_cache = LookupCache("geoapify_details", self.CACHE_TTL_SECONDS, redis_cache)
+        self._validators = SimpleCache(max_entries=4096)
     
     async def fetch_by_coords(
         self, 
@@ -105,12 +138,9 @@ class GeoapifyClient:
         Returns:
             Dict with normalized POI data or None
         """
-        # Default to broad tourism/entertainment categories
-        if not categories:
-            categories = ["tourism", "entertainment", "heritage", "leisure.park"]
-        
         params = {
-            "categories": ",".join(categories),
+            # Default to broad tourism/entertainment categories
+            "categories": ",".join(categories) if categories else self.DEFAULT_CATEGORIES,
             "filter": f"circle:{lon},{lat},{radius}",
             "limit": 1,
             "lang": lang,
@@ -121,7 +151,17 @@ class GeoapifyClient:
         if name:
             params["name"] = name
         
-        return await self._call_places_api(params)
+        cache_params = {
+            "lat": round(lat, self.CACHE_COORD_PRECISION),
+            "lon": round(lon, self.CACHE_COORD_PRECISION),
+            "radius": radius,
+            "categories": params["categories"],
+            "name": name,
+            "lang": lang,
+        }
+        return await self._places_cache.get_or_fetch(
+            cache_params, lambda: self._call_places_api(params)
+        )
     
     async def fetch_by_name(
         self,
@@ -155,7 +195,9 @@ class GeoapifyClient:
             "apiKey": self.api_key,
         }
         
-        return await self._call_geocode_api(params)
+        return await self._geocode_cache.get_or_fetch(
+            {"text": query, "lang": lang}, lambda: self._call_geocode_api(params)
+        )
     
     async def fetch_place_details(
         self,
@@ -174,201 +216,174 @@ class GeoapifyClient:
         Returns:
             Dict with detailed POI data or None
         """
-        if not features:
-            features = ["details"]
-        
         params = {
             "id": place_id,
-            "features": ",".join(features),
+            "features": ",".join(features) if features else self.DEFAULT_DETAIL_FEATURES,
             "lang": lang,
             "apiKey": self.api_key,
         }
         
-        try:
-            response = await self.http.get(
-                self.PLACE_DETAILS_API_URL,
-                params=params,
-                headers={"Accept": "application/json"},
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            features_list = data.get("features", [])
-            if features_list:
-                return self._normalize_details(features_list[0])
-        except Exception:
-            pass
-        
-        return None
+        return await self._details_cache.get_or_fetch(
+            {"id": place_id, "features": params["features"], "lang": lang},
+            lambda: self._call_details_api(params),
+        )
+    
+    async def _call_details_api(self, params: Dict) -> Optional[Dict[str, Any]]:
+        """Call Place Details API and normalize response."""
+        return await self._get_first_feature(
+            self.PLACE_DETAILS_API_URL, params, self._normalize_details, revalidate=True
+        )
     
     async def _call_places_api(self, params: Dict) -> Optional[Dict[str, Any]]:
         """Call Places API and normalize response."""
-        try:
-            response = await self.http.get(
-                self.PLACES_API_URL,
-                params=params,
-                headers={"Accept": "application/json"},
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            features = data.get("features", [])
-            if features:
-                return self._normalize_place(features[0])
-        except Exception:
-            pass
-        
-        return None
+        return await self._get_first_feature(
+            self.PLACES_API_URL, params, self._normalize_place, revalidate=True
+        )
     
     async def _call_geocode_api(self, params: Dict) -> Optional[Dict[str, Any]]:
         """Call Geocoding API and normalize response."""
+        return await self._get_first_feature(self.GEOCODE_API_URL, params, self._normalize_geocode)
+    
+    async def _get_first_feature(
+        self,
+        url: str,
+        params: Dict,
+        normalize: Callable[[Dict[str, Any]], Dict[str, Any]],
+        revalidate: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        GET a Geoapify endpoint and normalize the first returned feature.
+        
+        With ``revalidate``, a previous response's ETag / Last-Modified is
+        sent back as a conditional request; a 304 reuses the stored result
+        without downloading or parsing a body.
+        """
+        headers = self._default_headers
+        validator_key = None
+        validated = None
+        if revalidate:
+            validator_key = f"{url}:{sorted((k, v) for k, v in params.items() if k != 'apiKey')}"
+            validated = self._validators.get(validator_key)
+            if validated:
+                etag, last_modified, _ = validated
+                headers = dict(headers)
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+        
         try:
-            response = await self.http.get(
-                self.GEOCODE_API_URL,
-                params=params,
-                headers={"Accept": "application/json"},
-                timeout=10.0,
-            )
+            response = await self.http.get(url, params=params, headers=headers, timeout=call_timeout(10.0))
+            if response.status_code == 304 and validated:
+                return validated[2]
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             features = data.get("features", [])
             if features:
-                return self._normalize_geocode(features[0])
+                result = normalize(features[0])
+                if validator_key:
+                    etag = response.headers.get("etag")
+                    last_modified = response.headers.get("last-modified")
+                    if etag or last_modified:
+                        self._validators.set(
+                            validator_key, (etag, last_modified, result), self.VALIDATOR_TTL_SECONDS
+                        )
+                return result
         except Exception:
             pass
         
         return None
     
-    def _normalize_place(self, feature: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _normalize_place(feature: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize Places API response to standard format."""
-        props = feature.get("properties", {})
-        datasource = props.get("datasource", {})
-        raw = datasource.get("raw", {})
-        geometry = feature.get("geometry", {})
-        coords = geometry.get("coordinates", [None, None])
-        
-        # Opening hours (from raw OSM data)
-        opening_hours = props.get("opening_hours") or raw.get("opening_hours")
-        hours = None
-        if opening_hours:
-            hours = {
-                "weekly": None,  # String format like "Mo-Sa 07:00-20:00"
-                "raw": opening_hours,
-            }
-        
-        # Contact info
-        contact = props.get("contact", {})
-        phone = contact.get("phone") or raw.get("phone")
-        website = props.get("website") or raw.get("website")
-        email = contact.get("email") or raw.get("email")
-        
-        # Facilities
-        facilities = props.get("facilities", {})
-        
-        # Payment options
-        payment = props.get("payment_options", {})
-        
-        # Brand info
-        brand = props.get("brand")
-        brand_details = props.get("brand_details", {})
-        
-        # Categories
-        categories = props.get("categories", [])
-        
+        props: Dict[str, Any] = feature.get("properties") or {}
+        get = props.get
+        raw: Dict[str, Any] = (get("datasource") or {}).get("raw") or {}
+        raw_get = raw.get
+        contact = get("contact") or {}
+        brand_details = get("brand_details") or {}
+        lng, lat, *_ = (*((feature.get("geometry") or {}).get("coordinates") or ()), None, None)
+
+        # Opening hours (from raw OSM data); "weekly" is left for a string
+        # format like "Mo-Sa 07:00-20:00"
+        opening_hours = get("opening_hours") or raw_get("opening_hours")
+
         return {
-            "name": props.get("name"),
-            "formatted_address": props.get("formatted"),
-            "address_line1": props.get("address_line1"),
-            "address_line2": props.get("address_line2"),
-            "country": props.get("country"),
-            "country_code": props.get("country_code"),
-            "city": props.get("city"),
-            "postcode": props.get("postcode"),
-            "street": props.get("street"),
-            "location": {
-                "lat": coords[1] if len(coords) > 1 else None,
-                "lng": coords[0] if len(coords) > 0 else None,
-            },
-            "phone": phone,
-            "website": website,
-            "email": email,
-            "hours": hours,
-            "categories": categories,
-            "facilities": facilities,
-            "payment_options": payment,
-            "brand": brand,
+            "name": get("name"),
+            "formatted_address": get("formatted"),
+            "address_line1": get("address_line1"),
+            "address_line2": get("address_line2"),
+            "country": get("country"),
+            "country_code": get("country_code"),
+            "city": get("city"),
+            "postcode": get("postcode"),
+            "street": get("street"),
+            "location": {"lat": lat, "lng": lng},
+            "phone": contact.get("phone") or raw_get("phone"),
+            "website": get("website") or raw_get("website"),
+            "email": contact.get("email") or raw_get("email"),
+            "hours": {"weekly": None, "raw": opening_hours} if opening_hours else None,
+            "categories": get("categories", []),
+            "facilities": get("facilities", {}),
+            "payment_options": get("payment_options", {}),
+            "brand": get("brand"),
             "brand_wikidata": brand_details.get("wikidata"),
             "brand_wikipedia": brand_details.get("wikipedia"),
-            "description": raw.get("description"),
-            "place_id": props.get("place_id"),
-            "osm_id": raw.get("osm_id"),
-            "osm_type": raw.get("osm_type"),
+            "description": raw_get("description"),
+            "place_id": get("place_id"),
+            "osm_id": raw_get("osm_id"),
+            "osm_type": raw_get("osm_type"),
         }
     
-    def _normalize_geocode(self, feature: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _normalize_geocode(feature: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize Geocoding API response."""
-        props = feature.get("properties", {})
+        get = (feature.get("properties") or {}).get
         
         return {
-            "name": props.get("name") or props.get("address_line1"),
-            "formatted_address": props.get("formatted"),
-            "country": props.get("country"),
-            "country_code": props.get("country_code"),
-            "city": props.get("city"),
-            "location": {
-                "lat": props.get("lat"),
-                "lng": props.get("lon"),
-            },
-            "categories": props.get("categories", []),
-            "place_id": props.get("place_id"),
+            "name": get("name") or get("address_line1"),
+            "formatted_address": get("formatted"),
+            "country": get("country"),
+            "country_code": get("country_code"),
+            "city": get("city"),
+            "location": {"lat": get("lat"), "lng": get("lon")},
+            "categories": get("categories", []),
+            "place_id": get("place_id"),
         }
     
-    def _normalize_details(self, feature: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _normalize_details(feature: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize Place Details API response."""
-        props = feature.get("properties", {})
-        
-        # Extract wiki references
-        wiki = props.get("wiki_and_media", {})
-        
-        # Extract facilities
-        facilities = props.get("facilities", {})
-        
-        # Extract contact
-        contact = {
-            "phone": props.get("contact", {}).get("phone"),
-            "website": props.get("website"),
-            "email": props.get("contact", {}).get("email"),
-        }
+        get = (feature.get("properties") or {}).get
+        wiki = get("wiki_and_media") or {}
+        contact = get("contact") or {}
+        opening_hours = get("opening_hours")
         
         return {
-            "name": props.get("name"),
-            "formatted_address": props.get("formatted"),
-            "country": props.get("country"),
-            "city": props.get("city"),
-            "location": {
-                "lat": props.get("lat"),
-                "lng": props.get("lon"),
-            },
+            "name": get("name"),
+            "formatted_address": get("formatted"),
+            "country": get("country"),
+            "city": get("city"),
+            "location": {"lat": get("lat"), "lng": get("lon")},
             "phone": contact.get("phone"),
-            "website": contact.get("website"),
+            "website": get("website"),
             "email": contact.get("email"),
-            "hours": {"raw": props.get("opening_hours")} if props.get("opening_hours") else None,
-            "facilities": facilities,
-            "description": props.get("description"),
+            "hours": {"raw": opening_hours} if opening_hours else None,
+            "facilities": get("facilities", {}),
+            "description": get("description"),
             "wikidata": wiki.get("wikidata"),
             "wikipedia": wiki.get("wikipedia"),
             "image": wiki.get("image"),
-            "place_id": props.get("place_id"),
-            "categories": props.get("categories", []),
+            "place_id": get("place_id"),
+            "categories": get("categories", []),
         }
     
     @staticmethod
     def source_meta(fields: list[str]) -> Dict[str, Any]:
         return {
             "name": "geoapify",
-            "last_fetched": datetime.utcnow().isoformat(),
+            "last_fetched": utc_now_iso(),
             "fields": fields,
         }
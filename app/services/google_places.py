@@ -1,40 +1,54 @@
 from __future__ import annotations
-from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
 import httpx
-from datetime import datetime
+import orjson
+
+from app.core.cache import LookupCache
+from app.core.deadline import call_timeout
+from app.utils.timestamps import utc_now_iso
+
+# Google weekday numbers (0 = Sunday) as weekly-hours keys
+_DAY_KEYS = ("0", "1", "2", "3", "4", "5", "6")
 
 
 class GooglePlacesClient:
-    def __init__(self, api_key: str, http_client: httpx.AsyncClient, daily_cap: int = 9500):
+    CACHE_TTL_SECONDS = 86400
+
+    __slots__ = (
+        "api_key",
+        "http",
+        "daily_cap",
+        "_request_count",
+        "_quota_day",
+        "_search_headers",
+        "_details_headers",
+        "_search_cache",
+        "_details_cache",
+    )
+
+    def __init__(
+        self,
+        api_key: str,
+        http_client: httpx.AsyncClient,
+        daily_cap: int = 9500,
+        redis_cache: Optional[Any] = None,
+    ):
         self.api_key = api_key
-        self.http = httpx.AsyncClient() if http_client is None else http_client
+        self.http = (
+            httpx.AsyncClient(http2=True, limits=httpx.Limits(max_keepalive_connections=16))
+            if http_client is None
+            else http_client
+        )
         self.daily_cap = daily_cap
         self._request_count = 0
-
-    def _guard_quota(self) -> None:
-        if self._request_count >= self.daily_cap:
-            raise RuntimeError("Google Places daily cap reached; refusing external calls")
-        self._request_count += 1
-
-    async def text_search(self, poi_name: str, city: str) -> Optional[Dict[str, Any]]:
-        self._guard_quota()
-        url = "https://places.googleapis.com/v1/places:searchText"
-        headers = {
-            "X-Goog-Api-Key": self.api_key,
+        self._quota_day = datetime.now(timezone.utc).date()
+        self._search_headers = {
+            "X-Goog-Api-Key": api_key,
             "X-Goog-FieldMask": "places.id,places.displayName,places.formattedAddress,places.location",
         }
-        payload = {"textQuery": f"{poi_name}, {city}", "languageCode": "en"}
-        response = await self.http.post(url, headers=headers, json=payload, timeout=10.0)
-        response.raise_for_status()
-        data = response.json()
-        places = data.get("places", [])
-        return places[0] if places else None
-
-    async def place_details(self, place_id: str) -> Optional[Dict[str, Any]]:
-        self._guard_quota()
-        url = f"https://places.googleapis.com/v1/places/{place_id}"
-        headers = {
-            "X-Goog-Api-Key": self.api_key,
+        self._details_headers = {
+            "X-Goog-Api-Key": api_key,
             "X-Goog-FieldMask": ",".join(
                 [
                     "id",
@@ -50,9 +64,51 @@ class GooglePlacesClient:
                 ]
             ),
         }
-        response = await self.http.get(url, headers=headers, timeout=10.0)
+        self._search_cache = LookupCache("gplaces_search", self.CACHE_TTL_SECONDS, redis_cache)
+        self._details_cache = LookupCache("gplaces_details", self.CACHE_TTL_SECONDS, redis_cache)
+
+    def _guard_quota(self) -> None:
+        # Check and count in one synchronous step (no await in between), and
+        # start a fresh count each UTC day so the cap really is daily
+        today = datetime.now(timezone.utc).date()
+        if today != self._quota_day:
+            self._quota_day = today
+            self._request_count = 0
+        if self._request_count >= self.daily_cap:
+            raise RuntimeError("Google Places daily cap reached; refusing external calls")
+        self._request_count += 1
+
+    @staticmethod
+    def _search_key(poi_name: str, city: str) -> Tuple[str, str]:
+        return poi_name.strip().lower(), city.strip().lower()
+
+    async def text_search(self, poi_name: str, city: str) -> Optional[Dict[str, Any]]:
+        key_name, key_city = self._search_key(poi_name, city)
+        return await self._search_cache.get_or_fetch(
+            {"poi_name": key_name, "city": key_city}, lambda: self._text_search(poi_name, city)
+        )
+
+    async def place_details(self, place_id: str) -> Optional[Dict[str, Any]]:
+        return await self._details_cache.get_or_fetch(
+            {"place_id": place_id}, lambda: self._place_details(place_id)
+        )
+
+    async def _text_search(self, poi_name: str, city: str) -> Optional[Dict[str, Any]]:
+        self._guard_quota()
+        url = "https://places.googleapis.com/v1/places:searchText"
+        payload = {"textQuery": f"{poi_name}, {city}", "languageCode": "en"}
+        response = await self.http.post(url, headers=self._search_headers, json=payload, timeout=call_timeout(10.0))
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        places = data.get("places", [])
+        return places[0] if places else None
+
+    async def _place_details(self, place_id: str) -> Optional[Dict[str, Any]]:
+        self._guard_quota()
+        url = f"https://places.googleapis.com/v1/places/{place_id}"
+        response = await self.http.get(url, headers=self._details_headers, timeout=call_timeout(10.0))
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     @staticmethod
     def normalize_basic(place: Dict[str, Any]) -> Dict[str, Any]:
@@ -67,14 +123,16 @@ class GooglePlacesClient:
         weekly = None
         if regular_hours and regular_hours.get("periods"):
             weekly = {}
-            for period in regular_hours.get("periods", []):
-                day = period.get("open", {}).get("day")
-                open_time = period.get("open", {}).get("time")
-                close_time = period.get("close", {}).get("time") if period.get("close") else None
+            for period in regular_hours["periods"]:
+                opening = period.get("open") or {}
+                day = opening.get("day")
+                open_time = opening.get("time")
                 if day is not None and open_time:
+                    close_time = (period.get("close") or {}).get("time")
                     # Format: "HHMM-HHMM" or just "HHMM" if no close time
-                    time_range = "-".join(filter(None, [open_time, close_time])) if close_time else open_time
-                    weekly.setdefault(str(day), []).append(time_range)
+                    time_range = f"{open_time}-{close_time}" if close_time else open_time
+                    day_key = _DAY_KEYS[day] if 0 <= day < 7 else str(day)
+                    weekly.setdefault(day_key, []).append(time_range)
         return {
             "name": place.get("displayName", {}).get("text"),
             "formatted_address": place.get("formattedAddress"),
@@ -88,4 +146,4 @@ class GooglePlacesClient:
 
     @staticmethod
     def source_meta(fields: list[str]) -> Dict[str, Any]:
-        return {"name": "google_places", "last_fetched": datetime.utcnow().isoformat(), "fields": fields}
+        return {"name": "google_places", "last_fetched": utc_now_iso(), "fields": fields}
@@ -5,20 +5,91 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
-from typing import TYPE_CHECKING, Optional
+from typing import Optional
 
-if TYPE_CHECKING:
-    import httpx
+import httpx
+import orjson
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from app.core.cache import SingleFlight
+from app.core.deadline import call_timeout, remaining
 
 logger = logging.getLogger(__name__)
 
+# Jittered backoff so a rate-limited batch does not retry in lockstep
+_BACKOFF = wait_random_exponential(multiplier=1, max=8)
+
+# Minimum time left for another attempt to be worth starting
+_MIN_ATTEMPT_SECONDS = 1.0
+
+
+def _retry_after(error: Optional[BaseException]) -> Optional[float]:
+    """Seconds requested by a 429's Retry-After header, if any."""
+    if isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 429:
+        try:
+            return float(error.response.headers.get("retry-after", ""))
+        except ValueError:
+            pass
+    return None
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Backoff before the next attempt: Retry-After on 429, else jittered exponential."""
+    wait = _retry_after(retry_state.outcome.exception())
+    if wait is None:
+        wait = _BACKOFF(retry_state)
+    # Never sleep past the request deadline
+    return max(0.0, min(wait, remaining() - _MIN_ATTEMPT_SECONDS))
+
+
+def _deadline_reached(retry_state: RetryCallState) -> bool:
+    """Stop retrying once no useful attempt fits before the deadline."""
+    wait = _retry_after(retry_state.outcome.exception()) or 0.0
+    return remaining() <= wait + _MIN_ATTEMPT_SECONDS
+
+
+# "HEADLINE: ..." / "DESCRIPTION: ..." at the start of a line (preferred)
+_HEADLINE_LINE_RE = re.compile(r"^[ \t]*HEADLINE:(.*)$", re.IGNORECASE | re.MULTILINE)
+_DESCRIPTION_LINE_RE = re.compile(r"^[ \t]*DESCRIPTION:(.*)$", re.IGNORECASE | re.MULTILINE)
+
+# Non-empty marker line terminated by a newline (streaming early exit)
+_HEADLINE_DONE_RE = re.compile(r"^[ \t]*HEADLINE:[ \t]*\S[^\n]*\n", re.IGNORECASE | re.MULTILINE)
+_DESCRIPTION_DONE_RE = re.compile(r"^[ \t]*DESCRIPTION:[ \t]*\S[^\n]*\n", re.IGNORECASE | re.MULTILINE)
+
+# Same markers anywhere in the text (fallback)
+_HEADLINE_RE = re.compile(r"HEADLINE:\s*(.+?)(?:\n|$)", re.IGNORECASE)
+_DESCRIPTION_RE = re.compile(r"DESCRIPTION:\s*(.+?)(?:\n|$)", re.IGNORECASE)
+
+# Invariant prompt parts, shared by every request
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "Tu es un copywriter voyage expert, creatif et precis. Reponds uniquement avec le format demande.",
+}
+
+_PROMPT_FOOTER = """
+Genere:
+1. Un titre accrocheur (max 50 caracteres) qui explique pourquoi CE pays pour CE profil
+2. Une description personnalisee (max 150 caracteres) avec des details specifiques
+
+Format strict:
+HEADLINE: [titre]
+DESCRIPTION: [description]
+
+Sois specifique et evite les phrases generiques comme "Decouvrez" ou "Explorez"."""
+
 
 class OpenAIClient:
     """
     Async OpenAI client for generating personalized travel content.
 
     Features:
-    - Retry logic with exponential backoff
+    - Retry logic with jittered exponential backoff (honors Retry-After)
     - Batch generation for multiple destinations
     - Graceful fallback on errors
     """
@@ -28,10 +99,12 @@ class OpenAIClient:
     DEFAULT_MAX_TOKENS = 300
     DEFAULT_TEMPERATURE = 0.7
 
+    __slots__ = ("_api_key", "_client", "_model", "_max_tokens", "_headers", "_inflight")
+
     def __init__(
         self,
         api_key: str,
-        http_client: "httpx.AsyncClient",
+        http_client: httpx.AsyncClient,
         model: str = DEFAULT_MODEL,
         max_tokens: int = DEFAULT_MAX_TOKENS,
     ):
@@ -52,6 +125,7 @@ class OpenAIClient:
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         }
+        self._inflight = SingleFlight()
 
     async def generate_destination_content(
         self,
@@ -63,6 +137,7 @@ class OpenAIClient:
         key_factors: list[str],
         top_activities: list[dict],
         max_retries: int = 3,
+        profile: Optional[str] = None,
     ) -> tuple[str, str]:
         """
         Generate personalized headline and description for a destination.
@@ -76,6 +151,8 @@ class OpenAIClient:
             key_factors: Key matching factors for this destination
             top_activities: Top activities in the destination
             max_retries: Number of retry attempts
+            profile: Prebuilt user-profile prompt block (see build_profile);
+                computed from the user fields when omitted
 
         Returns:
             Tuple of (headline, description)
@@ -83,80 +160,155 @@ class OpenAIClient:
         Raises:
             Exception: If all retries fail
         """
-        # Build context-aware prompt
-        interests_str = (
-            ", ".join(user_interests) if user_interests else "decouverte generale"
+        # Identical concurrent requests share one upstream call
+        key = (
+            country_name,
+            tuple(user_interests or ()),
+            travel_style,
+            occasion,
+            budget_level,
+            tuple(key_factors or ()),
+            tuple(a.get("name", "") for a in top_activities[:3]),
+        )
+        return await self._inflight.run(
+            key,
+            lambda: self._generate_destination_content(
+                country_name,
+                travel_style,
+                profile or self.build_profile(user_interests, budget_level, occasion),
+                key_factors,
+                top_activities,
+                max_retries,
+            ),
         )
-        activities_str = ", ".join([a.get("name", "") for a in top_activities[:3]])
-        factors_str = ", ".join(key_factors) if key_factors else "destination adaptee"
 
-        occasion_context = ""
-        if occasion:
-            occasion_context = f"- Occasion: {occasion}\n"
+    @staticmethod
+    def build_profile(
+        user_interests: list[str], budget_level: str, occasion: Optional[str]
+    ) -> str:
+        """
+        Build the user-profile block of the prompt.
 
-        prompt = f"""Tu es un expert en voyage. Genere du contenu pour {country_name} pour un voyageur {travel_style}.
+        It only depends on the user's preferences, so batch callers build it
+        once and reuse it for every destination.
+        """
+        parts = [
+            "\n\nProfil utilisateur:\n- Interets: ",
+            ", ".join(user_interests) if user_interests else "decouverte generale",
+            "\n- Budget: ",
+            budget_level,
+            "\n",
+        ]
+        if occasion:
+            parts += ["- Occasion: ", occasion, "\n"]
+        return "".join(parts)
 
-Profil utilisateur:
-- Interets: {interests_str}
-- Budget: {budget_level}
-{occasion_context}- Points forts de ce pays pour lui: {factors_str}
-- Activites populaires: {activities_str}
+    async def _generate_destination_content(
+        self,
+        country_name: str,
+        travel_style: str,
+        profile: str,
+        key_factors: list[str],
+        top_activities: list[dict],
+        max_retries: int,
+    ) -> tuple[str, str]:
+        # Build context-aware prompt
+        prompt = "".join(
+            [
+                "Tu es un expert en voyage. Genere du contenu pour ",
+                country_name,
+                " pour un voyageur ",
+                travel_style,
+                ".",
+                profile,
+                "- Points forts de ce pays pour lui: ",
+                ", ".join(key_factors) if key_factors else "destination adaptee",
+                "\n- Activites populaires: ",
+                ", ".join([a.get("name", "") for a in top_activities[:3]]),
+                "\n",
+                _PROMPT_FOOTER,
+            ]
+        )
 
-Genere:
-1. Un titre accrocheur (max 50 caracteres) qui explique pourquoi CE pays pour CE profil
-2. Une description personnalisee (max 150 caracteres) avec des details specifiques
+        # Retry transient failures with jittered backoff, within the deadline
+        try:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(max_retries) | _deadline_reached,
+                wait=_retry_wait,
+                retry=retry_if_exception_type(
+                    (httpx.HTTPStatusError, httpx.TransportError, ValueError)
+                ),
+                after=lambda state: logger.warning(
+                    f"OpenAI API attempt {state.attempt_number}/{max_retries} failed "
+                    f"for {country_name}: {state.outcome.exception()}"
+                ),
+                reraise=True,
+            ):
+                with attempt:
+                    return await self._request_content(prompt)
+        except Exception as e:
+            logger.error(f"All OpenAI API attempts failed for {country_name}: {e}")
+            raise
+
+    async def _request_content(self, prompt: str) -> tuple[str, str]:
+        """Run one streamed completion and parse it into (headline, description)."""
+        async with self._client.stream(
+            "POST",
+            f"{self.BASE_URL}/chat/completions",
+            headers=self._headers,
+            json={
+                "model": self._model,
+                "messages": [_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+                "max_tokens": self._max_tokens,
+                "temperature": self.DEFAULT_TEMPERATURE,
+                "stream": True,
+            },
+            timeout=call_timeout(30.0),
+        ) as response:
+            response.raise_for_status()
+            content = await self._read_stream(response)
+
+        headline, description = self._parse_response(content)
+        if headline and description:
+            return headline, description
+
+        raise ValueError("Failed to parse LLM response")
+
+    async def _read_stream(self, response: httpx.Response) -> str:
+        """
+        Accumulate a streamed (SSE) chat completion into the message content.
 
-Format strict:
-HEADLINE: [titre]
-DESCRIPTION: [description]
+        Stops reading as soon as both the HEADLINE and DESCRIPTION lines are
+        complete; leaving the stream context then closes the connection so
+        the remaining tokens are not waited for.
 
-Sois specifique et evite les phrases generiques comme "Decouvrez" ou "Explorez"."""
+        Args:
+            response: Open streaming response from /chat/completions
 
-        # Retry with exponential backoff
-        last_error = None
-        for attempt in range(max_retries):
-            try:
-                response = await self._client.post(
-                    f"{self.BASE_URL}/chat/completions",
-                    headers=self._headers,
-                    json={
-                        "model": self._model,
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": "Tu es un copywriter voyage expert, creatif et precis. Reponds uniquement avec le format demande.",
-                            },
-                            {"role": "user", "content": prompt},
-                        ],
-                        "max_tokens": self._max_tokens,
-                        "temperature": self.DEFAULT_TEMPERATURE,
-                    },
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                content = data["choices"][0]["message"]["content"]
-
-                # Parse response
-                headline, description = self._parse_response(content)
-
-                if headline and description:
-                    return headline, description
-
-                raise ValueError("Failed to parse LLM response")
-
-            except Exception as e:
-                last_error = e
-                logger.warning(
-                    f"OpenAI API attempt {attempt + 1}/{max_retries} failed for {country_name}: {e}"
-                )
-                if attempt < max_retries - 1:
-                    # Exponential backoff: 1s, 2s, 4s
-                    await asyncio.sleep(2**attempt)
-
-        logger.error(f"All OpenAI API attempts failed for {country_name}: {last_error}")
-        raise last_error or Exception("Unknown error")
+        Returns:
+            Message content received so far
+        """
+        parts: list[str] = []
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            payload = line[5:].strip()
+            if payload == "[DONE]":
+                break
+
+            choices = orjson.loads(payload).get("choices") or ()
+            delta = (choices[0].get("delta") or {}).get("content") if choices else None
+            if not delta:
+                continue
+            parts.append(delta)
+
+            # Only a newline can complete a marker line
+            if "\n" in delta:
+                content = "".join(parts)
+                if _HEADLINE_DONE_RE.search(content) and _DESCRIPTION_DONE_RE.search(content):
+                    break
+
+        return "".join(parts)
 
     def _parse_response(self, content: str) -> tuple[str, str]:
         """
@@ -168,29 +320,27 @@ Sois specifique et evite les phrases generiques comme "Decouvrez" ou "Explorez".
         Returns:
             Tuple of (headline, description)
         """
+        # Try to extract HEADLINE: and DESCRIPTION: lines (last one wins)
         headline = ""
+        for match in _HEADLINE_LINE_RE.finditer(content):
+            headline = match.group(1).strip()
         description = ""
+        for match in _DESCRIPTION_LINE_RE.finditer(content):
+            description = match.group(1).strip()
 
-        # Try to extract HEADLINE: and DESCRIPTION:
-        for line in content.strip().split("\n"):
-            line = line.strip()
-            if line.upper().startswith("HEADLINE:"):
-                headline = line[9:].strip()[:50]  # Max 50 chars
-            elif line.upper().startswith("DESCRIPTION:"):
-                description = line[12:].strip()[:150]  # Max 150 chars
-
-        # Fallback: try regex patterns
+        # Fallback: markers not at the start of a line
         if not headline:
-            match = re.search(r"HEADLINE:\s*(.+?)(?:\n|$)", content, re.IGNORECASE)
+            match = _HEADLINE_RE.search(content)
             if match:
-                headline = match.group(1).strip()[:50]
+                headline = match.group(1).strip()
 
         if not description:
-            match = re.search(r"DESCRIPTION:\s*(.+?)(?:\n|$)", content, re.IGNORECASE)
+            match = _DESCRIPTION_RE.search(content)
             if match:
-                description = match.group(1).strip()[:150]
+                description = match.group(1).strip()
 
-        return headline, description
+        # Max 50 / 150 chars
+        return headline[:50], description[:150]
 
     async def generate_batch(
         self,
@@ -218,7 +368,14 @@ Sois specifique et evite les phrases generiques comme "Decouvrez" ou "Explorez".
         """
         semaphore = asyncio.Semaphore(max_concurrent)
 
-        async def generate_one(dest: dict) -> tuple[str, str, str]:
+        # User preferences are identical across the batch: resolve them once
+        interests = user_preferences.get("interests", [])
+        travel_style = user_preferences.get("travel_style", "couple")
+        occasion = user_preferences.get("occasion")
+        budget_level = user_preferences.get("budget_level", "comfort")
+        profile = self.build_profile(interests, budget_level, occasion)
+
+        async def generate_one(index: int, dest: dict) -> tuple[int, tuple[str, str, str]]:
             async with semaphore:
                 country_code = dest.get("country_code", "")
                 country_name = dest.get("country_name", "Unknown")
@@ -226,26 +383,33 @@ Sois specifique et evite les phrases generiques comme "Decouvrez" ou "Explorez".
                 try:
                     headline, description = await self.generate_destination_content(
                         country_name=country_name,
-                        user_interests=user_preferences.get("interests", []),
-                        travel_style=user_preferences.get("travel_style", "couple"),
-                        occasion=user_preferences.get("occasion"),
-                        budget_level=user_preferences.get("budget_level", "comfort"),
+                        user_interests=interests,
+                        travel_style=travel_style,
+                        occasion=occasion,
+                        budget_level=budget_level,
                         key_factors=dest.get("key_factors", []),
                         top_activities=dest.get("top_activities", []),
+                        profile=profile,
                     )
-                    return (country_code, headline, description)
+                    return index, (country_code, headline, description)
 
                 except Exception as e:
                     logger.warning(f"Failed to generate content for {country_code}: {e}")
                     # Fallback content
-                    return (
+                    return index, (
                         country_code,
                         f"{country_name}, le choix ideal",
-                        f"Parfait pour votre voyage {user_preferences.get('travel_style', 'couple')}.",
+                        f"Parfait pour votre voyage {travel_style}.",
                     )
 
-        results = await asyncio.gather(*[generate_one(d) for d in destinations])
-        return list(results)
+        # Fill pre-sized slots as each generation completes (keeps input order)
+        results: list = [None] * len(destinations)
+        for future in asyncio.as_completed(
+            [generate_one(i, d) for i, d in enumerate(destinations)]
+        ):
+            index, content = await future
+            results[index] = content
+        return results
 
     @staticmethod
     def get_fallback_content(
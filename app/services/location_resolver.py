@@ -1,26 +1,67 @@
 """Service for resolving city names and geo coordinates to Viator destination IDs."""
 
 from __future__ import annotations
+import asyncio
 import logging
-from typing import Optional, Tuple
+from typing import Any, List, NamedTuple, Optional, Tuple
 from rapidfuzz import fuzz, process
 from motor.motor_asyncio import AsyncIOMotorCollection
 
+from app.core.cache import LookupCache, SimpleCache
+
 logger = logging.getLogger(__name__)
 
 
+class _Candidates(NamedTuple):
+    """Candidate cities for one country as index-aligned parallel lists."""
+
+    keys: List[str]  # Lowercased names, matched by rapidfuzz
+    names: List[str]
+    destination_ids: List[str]
+
+
 class LocationResolver:
     """Resolve city names and geo coordinates to Viator destination IDs."""
 
-    def __init__(self, destinations_collection: AsyncIOMotorCollection):
+    # Candidate city lists are refreshed at least this often (and on sync)
+    CANDIDATES_TTL_SECONDS = 3600
+    # Covered by the (type, country_code, name, destination_id) index
+    _CANDIDATE_PROJECTION = {"name": 1, "destination_id": 1, "_id": 0}
+
+    # City resolutions: bounded in-process LRU backed by Redis (shared by workers)
+    RESOLUTION_TTL_SECONDS = 86400
+    RESOLUTION_MAX_ENTRIES = 10_000
+
+    def __init__(
+        self,
+        destinations_collection: AsyncIOMotorCollection,
+        redis_cache: Optional[Any] = None
+    ):
         """
         Initialize location resolver.
 
         Args:
             destinations_collection: MongoDB collection for destinations
+            redis_cache: Optional RedisCache shared across workers
         """
         self.destinations = destinations_collection
-        self._cache = {}  # Simple in-memory cache for popular cities
+        self._resolutions = LookupCache(
+            "loc_resolve",
+            self.RESOLUTION_TTL_SECONDS,
+            redis_cache,
+            max_entries=self.RESOLUTION_MAX_ENTRIES,
+        )
+        # country_code (or "all") -> (candidate docs, lowercased names)
+        self._candidates = SimpleCache()
+
+    def invalidate(self) -> None:
+        """Drop cached candidates and resolutions (call after a destinations sync)."""
+        self._candidates.clear()
+        self._resolutions.clear()
+
+    @staticmethod
+    def _resolution_params(city: str, country_code: Optional[str]) -> dict:
+        return {"city": city.lower(), "cc": country_code.upper() if country_code else "all"}
 
     async def resolve_city(
         self,
@@ -37,43 +78,122 @@ class LocationResolver:
         Returns:
             Tuple of (destination_id, matched_city_name, match_score) or None
         """
-        # Check cache
-        cache_key = f"{city.lower()}:{country_code or 'all'}"
-        if cache_key in self._cache:
-            logger.info(f"Cache hit for city resolution: {cache_key}")
-            return self._cache[cache_key]
+        async def resolve() -> Optional[Tuple[str, str, float]]:
+            candidates = await self._load_candidates(country_code)
+            if not candidates.keys:
+                return None
+            return self._match_city(city, candidates)
+
+        result = await self._resolutions.get_or_fetch(
+            self._resolution_params(city, country_code), resolve
+        )
+        # Entries read back from Redis are JSON lists
+        return tuple(result) if result else None
+
+    async def resolve_cities_bulk(
+        self,
+        cities: List[str],
+        country_code: Optional[str] = None
+    ) -> List[Optional[Tuple[str, str, float]]]:
+        """
+        Resolve several city names against the same country in one pass.
+
+        The candidate list is fetched and lowercased once and shared by every
+        query, instead of once per resolve_city call.
+
+        Args:
+            cities: City names to search for
+            country_code: ISO country code for filtering (optional but recommended)
+
+        Returns:
+            One (destination_id, matched_city_name, match_score) or None per input city
+        """
+        candidates = await self._load_candidates(country_code)
+        if not candidates.keys:
+            return [None] * len(cities)
+
+        async def match(city: str) -> Optional[Tuple[str, str, float]]:
+            return self._match_city(city, candidates)
+
+        # In-memory hits return without I/O; misses go to Redis concurrently
+        # rather than one round-trip after another (gather keeps input order)
+        results = await asyncio.gather(*(
+            self._resolutions.get_or_fetch(
+                self._resolution_params(city, country_code), lambda city=city: match(city)
+            )
+            for city in cities
+        ))
+        return [tuple(result) if result else None for result in results]
+
+    async def _load_candidates(
+        self,
+        country_code: Optional[str]
+    ) -> _Candidates:
+        """
+        Candidate cities for a country, as parallel name / ID lists.
+
+        Loaded once per country and kept for CANDIDATES_TTL_SECONDS, so repeat
+        resolves skip the Mongo round-trip. Falls back to all countries when
+        the country has no cities.
+        """
+        key = country_code.upper() if country_code else "all"
+        cached = self._candidates.get(key)
+        if cached:
+            return cached
 
         # Build query
         query = {"type": "city"}
         if country_code:
-            query["country_code"] = country_code.upper()
-
-        # Fetch all cities (limited to 1000 for performance)
-        cursor = self.destinations.find(query).limit(1000)
-        cities = await cursor.to_list(length=1000)
+            query["country_code"] = key
+
+        # Fetch all cities (limited to 1000 for performance), straight into
+        # parallel lists
+        candidates = _Candidates([], [], [])
+        cursor = self.destinations.find(query, self._CANDIDATE_PROJECTION).limit(1000)
+        async for doc in cursor:
+            name = doc["name"]
+            candidates.keys.append(name.lower())
+            candidates.names.append(name)
+            candidates.destination_ids.append(doc["destination_id"])
 
         # If no cities found with country code, try without it (fallback)
-        if not cities and country_code:
+        if not candidates.keys and country_code:
             logger.warning(
                 f"No cities found with country_code={country_code}, trying without country filter..."
             )
-            query_without_country = {"type": "city"}
-            cursor = self.destinations.find(query_without_country).limit(1000)
-            cities = await cursor.to_list(length=1000)
+            return await self._load_candidates(None)
 
-        if not cities:
+        if not candidates.keys:
             logger.warning(
                 f"No cities found in database for query: {query}. "
                 f"Please run POST /admin/destinations/sync to populate the destinations collection."
             )
-            return None
+            return candidates
+
+        self._candidates.set(key, candidates, self.CANDIDATES_TTL_SECONDS)
+        return candidates
+
+    @staticmethod
+    def _match_city(
+        city: str,
+        candidates: _Candidates
+    ) -> Optional[Tuple[str, str, float]]:
+        """
+        Fuzzy-match a city against pre-lowercased candidate names.
+
+        Args:
+            city: City name to search for
+            candidates: Candidate cities for the country
 
-        # Fuzzy matching
-        city_names = [c["name"] for c in cities]
+        Returns:
+            Tuple of (destination_id, matched_city_name, match_score) or None
+        """
+        # Candidates are already lowercased: skip rapidfuzz's per-choice processing
         match = process.extractOne(
-            city,
-            city_names,
+            city.lower(),
+            candidates.keys,
             scorer=fuzz.ratio,
+            processor=None,
             score_cutoff=80  # Minimum 80% match
         )
 
@@ -81,18 +201,15 @@ class LocationResolver:
             logger.warning(f"No fuzzy match found for city '{city}'")
             return None
 
-        matched_name, score, _ = match
+        _, score, index = match
 
-        # Find destination ID
-        matched_city = next(c for c in cities if c["name"] == matched_name)
-        destination_id = matched_city["destination_id"]
+        # Matched position indexes straight into the parallel lists
+        matched_name = candidates.names[index]
+        destination_id = candidates.destination_ids[index]
 
         logger.info(f"Resolved '{city}' → '{matched_name}' (ID: {destination_id}, score: {score})")
 
-        result = (destination_id, matched_name, score)
-        self._cache[cache_key] = result
-
-        return result
+        return (destination_id, matched_name, score)
 
     async def resolve_geo(
         self,
@@ -111,40 +228,33 @@ class LocationResolver:
         Returns:
             Tuple of (destination_id, city_name, distance_km) or None
         """
-        # MongoDB geospatial query (requires 2dsphere index)
-        query = {
-            "location": {
-                "$near": {
-                    "$geometry": {
+        # $geoNear returns the nearest city with its distance computed
+        # server-side (requires 2dsphere index)
+        pipeline = [
+            {
+                "$geoNear": {
+                    "near": {
                         "type": "Point",
                         "coordinates": [lon, lat]  # [lon, lat] order for GeoJSON
                     },
-                    "$maxDistance": radius_km * 1000  # Convert to meters
+                    "distanceField": "distance_m",
+                    "maxDistance": radius_km * 1000,  # Convert to meters
+                    "query": {"type": "city"},
+                    "spherical": True,
                 }
             },
-            "type": "city"
-        }
+            {"$limit": 1},
+            {"$project": {"_id": 0, "destination_id": 1, "name": 1, "distance_m": 1}},
+        ]
 
-        destination = await self.destinations.find_one(query)
+        results = await self.destinations.aggregate(pipeline).to_list(length=1)
 
-        if not destination:
+        if not results:
             logger.warning(f"No destination found within {radius_km}km of ({lat}, {lon})")
             return None
 
-        # Calculate distance (approximation)
-        from math import radians, cos, sin, asin, sqrt
-
-        def haversine(lon1, lat1, lon2, lat2):
-            lon1, lat1, lon2, lat2 = map(radians, [lon1, lat1, lon2, lat2])
-            dlon = lon2 - lon1
-            dlat = lat2 - lat1
-            a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
-            c = 2 * asin(sqrt(a))
-            km = 6371 * c
-            return km
-
-        dest_coords = destination["location"]["coordinates"]
-        distance_km = haversine(lon, lat, dest_coords[0], dest_coords[1])
+        destination = results[0]
+        distance_km = destination["distance_m"] / 1000
 
         logger.info(
             f"Resolved geo ({lat}, {lon}) → '{destination['name']}' "
@@ -153,6 +263,31 @@ class LocationResolver:
 
         return (destination["destination_id"], destination["name"], distance_km)
 
+    async def resolve_geo_bulk(
+        self,
+        points: List[Tuple[float, float]],
+        radius_km: float = 50
+    ) -> List[Optional[Tuple[str, str, float]]]:
+        """
+        Find the nearest Viator destination for many (lat, lon) points.
+
+        Duplicate points are resolved once and the distinct lookups run
+        concurrently, each using the indexed $geoNear path of resolve_geo.
+
+        Args:
+            points: (lat, lon) pairs
+            radius_km: Search radius in kilometers
+
+        Returns:
+            One (destination_id, city_name, distance_km) or None per point
+        """
+        unique = list(dict.fromkeys(points))
+        resolved = await asyncio.gather(
+            *(self.resolve_geo(lat, lon, radius_km) for lat, lon in unique)
+        )
+        by_point = dict(zip(unique, resolved))
+        return [by_point[point] for point in points]
+
     async def get_destination_coordinates(self, destination_id: str) -> Optional[dict]:
         """
         Get coordinates for a destination by its ID.
@@ -5,7 +5,9 @@ Used as fallback for GPS coordinates when Google Places is unavailable.
 from __future__ import annotations
 from typing import Any, Dict, Optional
 import httpx
-from datetime import datetime
+import orjson
+
+from app.utils.timestamps import utc_now_iso
 
 
 class NominatimClient:
@@ -15,7 +17,12 @@ class NominatimClient:
     
     def __init__(self, user_agent: str, http_client: httpx.AsyncClient):
         self.user_agent = user_agent
-        self.http = http_client or httpx.AsyncClient()
+        self.http = (
+            httpx.AsyncClient(http2=True, limits=httpx.Limits(max_keepalive_connections=8))
+            if http_client is None
+            else http_client
+        )
+        self._headers = {"User-Agent": user_agent}
     
     async def geocode(self, poi_name: str, city: str) -> Optional[Dict[str, Any]]:
         """
@@ -28,18 +35,19 @@ class NominatimClient:
         Returns:
             Dict with location info or None if not found
         """
-        headers = {"User-Agent": self.user_agent}
+        # Strategies run one after the other on purpose: Nominatim's usage
+        # policy allows at most one request per second per client
         
         # Strategy 1: Search with POI name + city
-        result = await self._search(f"{poi_name}, {city}", headers)
+        result = await self._search(f"{poi_name}, {city}")
         if result:
             return result
         
         # Strategy 2: Try just POI name
-        result = await self._search(poi_name, headers)
+        result = await self._search(poi_name)
         return result
     
-    async def _search(self, query: str, headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    async def _search(self, query: str) -> Optional[Dict[str, Any]]:
         """Execute a search query on Nominatim."""
         try:
             response = await self.http.get(
@@ -50,11 +58,11 @@ class NominatimClient:
                     "limit": 1,
                     "addressdetails": 1,
                 },
-                headers=headers,
+                headers=self._headers,
                 timeout=10.0,
             )
             response.raise_for_status()
-            results = response.json()
+            results = orjson.loads(response.content)
             
             if results and len(results) > 0:
                 return self._normalize(results[0])
@@ -81,4 +89,4 @@ class NominatimClient:
     
     @staticmethod
     def source_meta(fields: list[str]) -> Dict[str, Any]:
-        return {"name": "nominatim", "last_fetched": datetime.utcnow().isoformat(), "fields": fields}
+        return {"name": "nominatim", "last_fetched": utc_now_iso(), "fields": fields}
@@ -1,29 +1,72 @@
 from datetime import datetime, timedelta
 from typing import Optional
 from motor.motor_asyncio import AsyncIOMotorCollection
+from app.core.cache import SimpleCache
 from app.models.poi import POIDocument
 
+# _id is not part of POIDocument; skip decoding it
+_POI_PROJECTION = {"_id": 0}
+
+# Fields needed to decide freshness without building a POIDocument
+_FRESHNESS_PROJECTION = {"_id": 0, "poi_key": 1, "last_updated": 1, "ttl_days": 1}
+
 
 class POIRepository:
+    # Short-lived read cache for repeat lookups of the same POI
+    CACHE_MAX_ENTRIES = 1024
+    CACHE_TTL_SECONDS = 60
+
     def __init__(self, collection: AsyncIOMotorCollection, ttl_days: int):
         self.collection = collection
         self.ttl_days = ttl_days
+        self._by_poi_key = SimpleCache(max_entries=self.CACHE_MAX_ENTRIES)
 
     async def get_by_poi_key(self, poi_key: str) -> Optional[POIDocument]:
-        raw = await self.collection.find_one({"poi_key": poi_key})
-        return POIDocument(**raw) if raw else None
+        cached = self._by_poi_key.get(poi_key)
+        if cached is not None:
+            return cached
+        raw = await self.collection.find_one({"poi_key": poi_key}, _POI_PROJECTION)
+        if not raw:
+            return None
+        doc = POIDocument.model_validate(raw)
+        self._by_poi_key.set(poi_key, doc, self.CACHE_TTL_SECONDS)
+        return doc
 
     async def get_by_place_id(self, place_id: str) -> Optional[POIDocument]:
-        raw = await self.collection.find_one({"place_id": place_id})
-        return POIDocument(**raw) if raw else None
+        raw = await self.collection.find_one({"place_id": place_id}, _POI_PROJECTION)
+        return POIDocument.model_validate(raw) if raw else None
 
     async def upsert(self, document: POIDocument) -> POIDocument:
         payload = document.model_dump()
         await self.collection.update_one(
             {"poi_key": document.poi_key}, {"$set": payload}, upsert=True
         )
+        # Write-through so the next read sees the new version
+        self._by_poi_key.set(document.poi_key, document, self.CACHE_TTL_SECONDS)
         return document
 
+    async def is_fresh_by_key(self, poi_key: str) -> bool:
+        raw = await self.collection.find_one({"poi_key": poi_key}, _FRESHNESS_PROJECTION)
+        return bool(raw) and self._raw_is_fresh(raw, datetime.utcnow())
+
+    async def bulk_fresh(self, poi_keys: list[str]) -> dict[str, bool]:
+        """Freshness of many POIs in one query (missing POIs are not fresh)."""
+        fresh = dict.fromkeys(poi_keys, False)
+        if not poi_keys:
+            return fresh
+        now = datetime.utcnow()
+        cursor = self.collection.find({"poi_key": {"$in": poi_keys}}, _FRESHNESS_PROJECTION)
+        async for raw in cursor:
+            fresh[raw["poi_key"]] = self._raw_is_fresh(raw, now)
+        return fresh
+
+    @staticmethod
+    def _raw_is_fresh(raw: dict, now: datetime) -> bool:
+        last_updated = raw.get("last_updated")
+        if not isinstance(last_updated, datetime):
+            return False
+        return now <= last_updated + timedelta(days=raw.get("ttl_days", 365))
+
     def is_fresh(self, doc: POIDocument) -> bool:
         expiry = doc.last_updated + timedelta(days=doc.ttl_days)
         return datetime.utcnow() <= expiry
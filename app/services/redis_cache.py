@@ -4,14 +4,28 @@ from __future__ import annotations
 import json
 import hashlib
 import logging
-from typing import Optional, Any
+from typing import Any, Awaitable, Callable, Optional
+import orjson
 from upstash_redis import Redis
+from upstash_redis.asyncio import Redis as AsyncRedis
 
 logger = logging.getLogger(__name__)
 
+# Canonical serialization for cache keys (non-str keys are stringified like json.dumps)
+_KEY_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
 
 class RedisCache:
-    """Service for caching data in Upstash Redis."""
+    """
+    Service for caching data in Upstash Redis.
+
+    The plain methods are blocking and meant for sync code paths (threadpool
+    handlers); async code should use the ``*_async`` variants, which go
+    through Upstash's async client and keep the event loop free.
+    """
+
+    # Keys requested per SCAN page in clear_pattern
+    SCAN_BATCH_SIZE = 500
 
     def __init__(self, url: str, token: str):
         """
@@ -22,9 +36,14 @@ class RedisCache:
             token: Upstash Redis REST token
         """
         self._redis = Redis(url=url, token=token)
+        self._async_redis = AsyncRedis(url=url, token=token)
         logger.info("Redis cache initialized")
 
-    def _generate_key(self, prefix: str, params: dict) -> str:
+    async def close(self) -> None:
+        """Close the async client's HTTP connections."""
+        await self._async_redis.close()
+
+    def compute_key(self, prefix: str, params: dict) -> str:
         """
         Generate a unique cache key based on prefix and parameters.
 
@@ -35,9 +54,10 @@ class RedisCache:
         Returns:
             Unique cache key string
         """
-        # Sort params to ensure consistent key generation
-        sorted_params = json.dumps(params, sort_keys=True)
-        param_hash = hashlib.md5(sorted_params.encode()).hexdigest()
+        # Sort params to ensure consistent key generation; blake2b gives the
+        # same 32-hex-char digest length as the previous MD5 keys
+        sorted_params = orjson.dumps(params, option=_KEY_OPTIONS)
+        param_hash = hashlib.blake2b(sorted_params, digest_size=16).hexdigest()
         return f"{prefix}:{param_hash}"
 
     def get(self, prefix: str, params: dict) -> Optional[Any]:
@@ -52,21 +72,73 @@ class RedisCache:
             Cached data if found, None otherwise
         """
         try:
-            key = self._generate_key(prefix, params)
-            cached = self._redis.get(key)
+            key = self.compute_key(prefix, params)
+            return self._decode(key, self._redis.get(key))
+
+        except Exception as e:
+            logger.error(f"Error getting cache: {e}", exc_info=True)
+            return None
 
-            if cached:
-                logger.info(f"Cache HIT for key: {key}")
-                # Upstash returns string, parse JSON
-                return json.loads(cached) if isinstance(cached, str) else cached
-            else:
-                logger.info(f"Cache MISS for key: {key}")
-                return None
+    async def get_or_set_async(
+        self,
+        prefix: str,
+        params: dict,
+        factory: Callable[[], Awaitable[Optional[Any]]],
+        ttl_seconds: int = 86400  # 24 hours default
+    ) -> Optional[Any]:
+        """
+        Return cached data, or await ``factory()`` and cache its result.
+
+        The key is derived once for both the read and the write. None
+        results are not cached.
+
+        Args:
+            prefix: Cache key prefix
+            params: Parameters used to generate cache key
+            factory: Zero-argument coroutine factory called on a miss
+            ttl_seconds: Time to live in seconds (default: 86400 = 24 hours)
+
+        Returns:
+            Cached or freshly produced data
+        """
+        key = self.compute_key(prefix, params)
+        try:
+            cached = self._decode(key, await self._async_redis.get(key))
+            if cached is not None:
+                return cached
+        except Exception as e:
+            logger.error(f"Error getting cache: {e}", exc_info=True)
+
+        data = await factory()
+        if data is not None:
+            try:
+                await self._async_redis.setex(key, ttl_seconds, json.dumps(data))
+                logger.info(f"Cache SET for key: {key} (TTL: {ttl_seconds}s)")
+            except Exception as e:
+                logger.error(f"Error setting cache: {e}", exc_info=True)
+        return data
+
+    async def get_async(self, prefix: str, params: dict) -> Optional[Any]:
+        """Async variant of :meth:`get`."""
+        try:
+            key = self.compute_key(prefix, params)
+            return self._decode(key, await self._async_redis.get(key))
 
         except Exception as e:
             logger.error(f"Error getting cache: {e}", exc_info=True)
             return None
 
+    @staticmethod
+    def _decode(key: str, cached: Any) -> Optional[Any]:
+        """Parse a raw GET reply into the cached data (None on miss)."""
+        if cached:
+            logger.info(f"Cache HIT for key: {key}")
+            # Upstash returns string, parse JSON
+            return json.loads(cached) if isinstance(cached, str) else cached
+
+        logger.info(f"Cache MISS for key: {key}")
+        return None
+
     def set(
         self,
         prefix: str,
@@ -87,7 +159,7 @@ class RedisCache:
             True if successful, False otherwise
         """
         try:
-            key = self._generate_key(prefix, params)
+            key = self.compute_key(prefix, params)
 
             # Serialize data to JSON
             serialized = json.dumps(data)
@@ -102,6 +174,24 @@ class RedisCache:
             logger.error(f"Error setting cache: {e}", exc_info=True)
             return False
 
+    async def set_async(
+        self,
+        prefix: str,
+        params: dict,
+        data: Any,
+        ttl_seconds: int = 86400  # 24 hours default
+    ) -> bool:
+        """Async variant of :meth:`set`."""
+        try:
+            key = self.compute_key(prefix, params)
+            await self._async_redis.setex(key, ttl_seconds, json.dumps(data))
+            logger.info(f"Cache SET for key: {key} (TTL: {ttl_seconds}s)")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error setting cache: {e}", exc_info=True)
+            return False
+
     def delete(self, prefix: str, params: dict) -> bool:
         """
         Delete cached data from Redis.
@@ -114,7 +204,7 @@ class RedisCache:
             True if successful, False otherwise
         """
         try:
-            key = self._generate_key(prefix, params)
+            key = self.compute_key(prefix, params)
             self._redis.delete(key)
             logger.info(f"Cache DELETE for key: {key}")
             return True
@@ -123,6 +213,18 @@ class RedisCache:
             logger.error(f"Error deleting cache: {e}", exc_info=True)
             return False
 
+    async def delete_async(self, prefix: str, params: dict) -> bool:
+        """Async variant of :meth:`delete`."""
+        try:
+            key = self.compute_key(prefix, params)
+            await self._async_redis.delete(key)
+            logger.info(f"Cache DELETE for key: {key}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error deleting cache: {e}", exc_info=True)
+            return False
+
     def clear_pattern(self, pattern: str) -> int:
         """
         Clear all keys matching a pattern.
@@ -134,18 +236,53 @@ class RedisCache:
             Number of keys deleted
         """
         try:
-            # Get all keys matching pattern
-            keys = self._redis.keys(pattern)
+            # SCAN pages through matching keys without blocking Redis like KEYS;
+            # each page becomes one UNLINK, all sent in a single pipeline
+            pipeline = self._redis.pipeline()
+            batches = 0
+            cursor = 0
+            while True:
+                cursor, keys = self._redis.scan(cursor, match=pattern, count=self.SCAN_BATCH_SIZE)
+                if keys:
+                    pipeline.unlink(*keys)
+                    batches += 1
+                if cursor == 0:
+                    break
+
+            if not batches:
+                logger.info(f"No keys found for pattern: {pattern}")
+                return 0
 
-            if not keys:
+            deleted = sum(pipeline.exec())
+
+            logger.info(f"Cleared {deleted} keys matching pattern: {pattern}")
+            return deleted
+
+        except Exception as e:
+            logger.error(f"Error clearing pattern {pattern}: {e}", exc_info=True)
+            return 0
+
+    async def clear_pattern_async(self, pattern: str) -> int:
+        """Async variant of :meth:`clear_pattern`."""
+        try:
+            pipeline = self._async_redis.pipeline()
+            batches = 0
+            cursor = 0
+            while True:
+                cursor, keys = await self._async_redis.scan(
+                    cursor, match=pattern, count=self.SCAN_BATCH_SIZE
+                )
+                if keys:
+                    pipeline.unlink(*keys)
+                    batches += 1
+                if cursor == 0:
+                    break
+
+            if not batches:
                 logger.info(f"No keys found for pattern: {pattern}")
                 return 0
 
-            # Delete all matching keys
-            deleted = 0
-            for key in keys:
-                self._redis.delete(key)
-                deleted += 1
+            deleted = sum(await pipeline.exec())
 
             logger.info(f"Cleared {deleted} keys matching pattern: {pattern}")
             return deleted
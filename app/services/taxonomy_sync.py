@@ -66,32 +66,30 @@ class TaxonomySyncService:
 
             logger.info(f"Fetched {len(viator_tags)} tags from Viator")
 
-            # 2. Process and upsert each tag
+            # 2. Transform each tag
+            tag_docs = []
             for viator_tag in viator_tags:
                 try:
                     # Transform Viator tag to our schema
                     tag_doc = self._transform_tag(viator_tag)
-
-                    # Count root vs child tags
-                    if tag_doc["parent_tag_id"] is None:
-                        stats["root_tags"] += 1
-                    else:
-                        stats["child_tags"] += 1
-
-                    # Upsert to MongoDB
-                    await self.repo.upsert_tag(
-                        tag_id=tag_doc["tag_id"],
-                        tag_data=tag_doc
-                    )
-
-                    stats["updated"] += 1
-
                 except Exception as e:
                     logger.error(
                         f"Error processing tag {viator_tag.get('tagId')}: {e}",
                         exc_info=True
                     )
                     stats["errors"] += 1
+                    continue
+
+                # Count root vs child tags
+                if tag_doc["parent_tag_id"] is None:
+                    stats["root_tags"] += 1
+                else:
+                    stats["child_tags"] += 1
+
+                tag_docs.append(tag_doc)
+
+            # 3. Upsert to MongoDB in bulk
+            stats["updated"] = await self.repo.upsert_tags_bulk(tag_docs)
 
             stats["completed_at"] = datetime.utcnow().isoformat()
 
@@ -4,41 +4,65 @@ Translates POI names to English for better Wikidata matching.
 Focuses on French → English translation with robust detection.
 """
 from __future__ import annotations
+import asyncio
 from typing import Optional, Tuple
 import httpx
+import orjson
 import re
 
 
+# Word tokens of a lowercased POI name
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Common English words for POI names
+_ENGLISH_WORDS = frozenset({
+    'the', 'of', 'in', 'at', 'on', 'for', 'and', 'or', 'with', 'to', 'from', 'by',
+    'tower', 'castle', 'church', 'museum', 'palace', 'park', 'square', 'bridge',
+    'station', 'street', 'avenue', 'road', 'lane', 'place', 'garden', 'hall',
+    'cathedral', 'abbey', 'monument', 'memorial', 'gallery', 'theatre', 'theater',
+    'library', 'university', 'college', 'school', 'hospital', 'hotel', 'restaurant',
+    'market', 'plaza', 'center', 'centre', 'building', 'house', 'mansion', 'villa',
+    'beach', 'bay', 'lake', 'river', 'mountain', 'hill', 'valley', 'forest',
+    'national', 'royal', 'grand', 'old', 'new', 'great', 'big', 'little', 'saint',
+    'north', 'south', 'east', 'west', 'upper', 'lower', 'central',
+    'falls', 'springs', 'heights', 'point', 'island', 'islands',
+})
+
+# French indicator words
+_FRENCH_WORDS = frozenset({
+    'de', 'la', 'le', 'les', 'du', 'des', 'aux', 'sur', 'sous', 'dans', 'par',
+    'château', 'église', 'cathédrale', 'musée', 'jardin', 'rue', 'pont',
+    'tour', 'palais', 'abbaye', 'plage', 'lac', 'montagne', 'forêt',
+    'notre', 'dame', 'sainte', 'grande', 'petit', 'petite', 'vieux', 'vieille',
+    'arc', 'triomphe', 'sacré', 'coeur', 'cœur', 'basilique', 'quartier',
+    'champs', 'élysées', 'louvre', 'versailles', 'invalides', 'opéra',
+    'gare', 'hôtel', 'ville', 'mairie', 'bibliothèque', 'théâtre',
+})
+
+# French diacritics
+_FRENCH_DIACRITICS = frozenset('àâäéèêëïîôùûüçœæ')
+
+# French articles used to break English/French ties
+_FRENCH_ARTICLES = frozenset({'le', 'la', 'les', 'du', 'des', 'de'})
+
+
+def _count_words(lowered: str) -> Tuple[int, int]:
+    """Count English vs French indicator words in already-lowercased text."""
+    english_count = french_count = 0
+    for word in _WORD_RE.findall(lowered):
+        if word in _ENGLISH_WORDS:
+            english_count += 1
+        if word in _FRENCH_WORDS:
+            french_count += 1
+    return english_count, french_count
+
+
 class TranslationClient:
     """Client for Travliaq-Translate service with French/English detection."""
     
-    # Common English words for POI names
-    ENGLISH_WORDS = {
-        'the', 'of', 'in', 'at', 'on', 'for', 'and', 'or', 'with', 'to', 'from', 'by',
-        'tower', 'castle', 'church', 'museum', 'palace', 'park', 'square', 'bridge',
-        'station', 'street', 'avenue', 'road', 'lane', 'place', 'garden', 'hall',
-        'cathedral', 'abbey', 'monument', 'memorial', 'gallery', 'theatre', 'theater',
-        'library', 'university', 'college', 'school', 'hospital', 'hotel', 'restaurant',
-        'market', 'plaza', 'center', 'centre', 'building', 'house', 'mansion', 'villa',
-        'beach', 'bay', 'lake', 'river', 'mountain', 'hill', 'valley', 'forest',
-        'national', 'royal', 'grand', 'old', 'new', 'great', 'big', 'little', 'saint',
-        'north', 'south', 'east', 'west', 'upper', 'lower', 'central',
-        'falls', 'springs', 'heights', 'point', 'island', 'islands',
-    }
-    
-    # French indicator words
-    FRENCH_WORDS = {
-        'de', 'la', 'le', 'les', 'du', 'des', 'aux', 'sur', 'sous', 'dans', 'par',
-        'château', 'église', 'cathédrale', 'musée', 'jardin', 'rue', 'pont',
-        'tour', 'palais', 'abbaye', 'plage', 'lac', 'montagne', 'forêt',
-        'notre', 'dame', 'sainte', 'grande', 'petit', 'petite', 'vieux', 'vieille',
-        'arc', 'triomphe', 'sacré', 'coeur', 'cœur', 'basilique', 'quartier',
-        'champs', 'élysées', 'louvre', 'versailles', 'invalides', 'opéra',
-        'gare', 'hôtel', 'ville', 'mairie', 'bibliothèque', 'théâtre',
-    }
-    
-    # French diacritics
-    FRENCH_DIACRITICS = set('àâäéèêëïîôùûüçœæ')
+    ENGLISH_WORDS = _ENGLISH_WORDS
+    FRENCH_WORDS = _FRENCH_WORDS
+    FRENCH_DIACRITICS = _FRENCH_DIACRITICS
     
     def __init__(self, base_url: str, http_client: httpx.AsyncClient):
         self.base_url = base_url.rstrip("/")
@@ -46,14 +70,11 @@ class TranslationClient:
     
     def _has_french_diacritics(self, text: str) -> bool:
         """Check if text contains French diacritical marks."""
-        return any(c.lower() in self.FRENCH_DIACRITICS for c in text)
+        return not _FRENCH_DIACRITICS.isdisjoint(text.lower())
     
     def _count_indicators(self, text: str) -> Tuple[int, int]:
         """Count English vs French indicator words."""
-        words = re.findall(r'\b\w+\b', text.lower())
-        english_count = sum(1 for w in words if w in self.ENGLISH_WORDS)
-        french_count = sum(1 for w in words if w in self.FRENCH_WORDS)
-        return english_count, french_count
+        return _count_words(text.lower())
     
     def is_french(self, text: str) -> bool:
         """
@@ -63,24 +84,26 @@ class TranslationClient:
         if not text or len(text.strip()) == 0:
             return False
         
-        # Check for French diacritics (strong indicator)
-        if self._has_french_diacritics(text):
+        lowered = text.lower()
+        
+        # Check for French diacritics (strong indicator); pure-ASCII text has none
+        if not text.isascii() and not _FRENCH_DIACRITICS.isdisjoint(lowered):
             return True
         
         # Count indicator words
-        english_count, french_count = self._count_indicators(text)
+        english_count, french_count = _count_words(lowered)
         
         # If more French words than English
         if french_count > english_count:
             return True
         
-        # If equal but has French articles (le, la, les, du, des)
-        words = text.lower().split()
-        french_articles = {'le', 'la', 'les', 'du', 'des', 'de'}
-        if french_count == english_count and any(w in french_articles for w in words):
-            return True
-        
-        return False
+        # If equal but has French articles (le, la, les, du, des). Articles are
+        # French indicator words themselves, so a 0-0 tie never qualifies and
+        # the common no-indicator case skips the split
+        return (
+            french_count == english_count > 0
+            and not _FRENCH_ARTICLES.isdisjoint(lowered.split())
+        )
     
     async def translate_to_english(self, text: str) -> str:
         """
@@ -114,7 +137,7 @@ class TranslationClient:
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 translated = data.get("translated_text") or data.get("text")
                 if translated and translated.strip() and translated != text:
                     return translated
@@ -124,7 +147,9 @@ class TranslationClient:
         return text
     
     async def translate_poi_name(self, poi_name: str, city: str) -> Tuple[str, str]:
-        """Translate both POI name and city to English."""
-        translated_poi = await self.translate_to_english(poi_name)
-        translated_city = await self.translate_to_english(city)
+        """Translate both POI name and city to English (concurrently)."""
+        translated_poi, translated_city = await asyncio.gather(
+            self.translate_to_english(poi_name),
+            self.translate_to_english(city),
+        )
         return translated_poi, translated_city
@@ -49,7 +49,7 @@ class ViatorAttractionsService:
                 - freeAttraction: boolean
                 - openingHours: string
         """
-        logger.info(f"Searching attractions for destination {destination_id}")
+        logger.debug("Searching attractions for destination %s", destination_id)
 
         # Build request body
         request_body = {
@@ -70,8 +70,10 @@ class ViatorAttractionsService:
             language=language
         )
 
-        attractions_count = len(response.get("attractions", []))
-        total_count = response.get("totalCount", 0)
-        logger.info(f"Found {attractions_count} attractions (total: {total_count})")
+        logger.debug(
+            "Found %d attractions (total: %s)",
+            len(response.get("attractions", [])),
+            response.get("totalCount", 0),
+        )
 
         return response
@@ -3,9 +3,21 @@
 from __future__ import annotations
 import asyncio
 import logging
-from typing import Optional, Any
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Set
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+import orjson
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from app.core.cache import LookupCache
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.core.rate_limit import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -17,13 +29,145 @@ class ViatorAPIError(Exception):
 
 class ViatorRateLimitError(ViatorAPIError):
     """Exception raised when rate limit is exceeded."""
-    pass
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        # Seconds the API asked us to wait (Retry-After), if it said
+        self.retry_after = retry_after
+
+
+# Attempts per request, including the first one
+MAX_ATTEMPTS = 5
+
+# Jittered backoff so rate-limited fan-outs do not retry in lockstep
+_BACKOFF = wait_random_exponential(multiplier=0.5, max=30)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After header in seconds (HTTP-date values are ignored)."""
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
+
+def _longest_prefix(endpoint: str, prefixes) -> Optional[str]:
+    """Longest of ``prefixes`` that ``endpoint`` starts with, if any."""
+    matches = [prefix for prefix in prefixes if endpoint.startswith(prefix)]
+    return max(matches, key=len) if matches else None
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Backoff before the next attempt, never shorter than the server's Retry-After."""
+    wait = _BACKOFF(retry_state)
+    error = retry_state.outcome.exception()
+    if isinstance(error, ViatorRateLimitError) and error.retry_after is not None:
+        wait = max(wait, error.retry_after)
+    return wait
+
+
+class BulkCoalescer:
+    """
+    Batch concurrent single-item lookups into one bulk request.
+
+    Keys submitted within ``flush_seconds`` of each other (or until
+    ``batch_size`` keys are pending) are fetched with a single
+    ``fetch_bulk(keys)`` call; each caller gets the item whose
+    ``key_field`` matches its key. Duplicate keys share one slot.
+    """
+
+    def __init__(
+        self,
+        fetch_bulk: Callable[[List[str]], Awaitable[List[dict]]],
+        key_field: str,
+        batch_size: int = 50,
+        flush_seconds: float = 0.015,
+    ):
+        self.fetch_bulk = fetch_bulk
+        self.key_field = key_field
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, key: str) -> dict:
+        """Fetch one item, batched with other keys submitted around the same time."""
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.flush_seconds, self._flush)
+        # Shield so one cancelled caller does not fail the others sharing the key
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: Dict[str, asyncio.Future]) -> None:
+        try:
+            items = await self.fetch_bulk(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        found = {item.get(self.key_field): item for item in items}
+        for key, future in batch.items():
+            if future.done():
+                continue
+            item = found.get(key)
+            if item is None:
+                future.set_exception(ViatorAPIError(f"{key} not returned by bulk lookup"))
+            else:
+                future.set_result(item)
 
 
 class ViatorClient:
     """HTTP client for Viator API with automatic retry and error handling."""
 
-    def __init__(self, api_key: str, base_url: str = "https://api.viator.com", http_client: Optional[httpx.AsyncClient] = None):
+    # GET response caching: path prefix -> TTL in seconds (longest prefix
+    # wins, 0 disables). Destinations and tags are only read by the admin
+    # sync jobs, which must see fresh data, so they are not cached.
+    CACHE_TTLS = {
+        "/partner/locations/": 86400,  # 24h
+        "/partner/products/": 3600,    # 1h (product details)
+        "/partner/products/tags": 0,
+        "/partner/destinations": 0,
+    }
+    CACHE_MAX_ENTRIES = 10_000
+
+    # Most refs /partner/locations/bulk accepts per request
+    MAX_BULK_LOCATIONS = 500
+
+    # Client-side admission: path prefix -> requests per second (longest
+    # prefix wins, "" is the default bucket)
+    RATE_LIMITS = {
+        "": 30.0,
+        "/partner/products/": 40.0,
+        "/partner/attractions/": 20.0,
+    }
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.viator.com",
+        http_client: Optional[httpx.AsyncClient] = None,
+        redis_cache: Optional[Any] = None,
+        max_concurrency: int = 50
+    ):
         """
         Initialize Viator API client.
 
@@ -31,11 +175,37 @@ class ViatorClient:
             api_key: Viator API key (exp-api-key)
             base_url: Base URL for Viator API
             http_client: Optional shared httpx.AsyncClient instance
+            redis_cache: Optional RedisCache used as L2 for cached GETs
+            max_concurrency: Maximum number of in-flight requests
         """
         self.api_key = api_key
         self.base_url = base_url
-        self.http_client = http_client or httpx.AsyncClient(timeout=30.0)
+        self.http_client = http_client or httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=50, max_connections=100, keepalive_expiry=30.0
+            ),
+        )
         self._own_client = http_client is None
+        self._headers_by_lang: Dict[str, Mapping[str, str]] = {}
+        self._response_caches = {
+            prefix: LookupCache(
+                f"viator_get:{prefix.strip('/').replace('/', '_')}",
+                ttl,
+                redis_cache,
+                max_entries=self.CACHE_MAX_ENTRIES,
+            )
+            for prefix, ttl in self.CACHE_TTLS.items()
+            if ttl > 0
+        }
+        self._buckets = {prefix: TokenBucket(rate) for prefix, rate in self.RATE_LIMITS.items()}
+        # Caps in-flight requests; the buckets cap the request rate
+        self._concurrency = asyncio.Semaphore(max_concurrency)
+        # Fails fast while Viator is down instead of waiting out timeouts
+        self._breaker = CircuitBreaker("viator", fail_max=10, reset_timeout=30.0)
+        # Single-location lookups are batched into /partner/locations/bulk
+        self._location_coalescer = BulkCoalescer(self.get_bulk_locations, key_field="reference")
 
         logger.info(f"ViatorClient initialized with base_url={base_url}")
 
@@ -44,18 +214,22 @@ class ViatorClient:
         if self._own_client:
             await self.http_client.aclose()
 
-    def _build_headers(self, language: str = "en") -> dict:
-        """Build request headers for Viator API."""
-        return {
-            "Accept": "application/json;version=2.0",
-            "Accept-Language": language,
-            "exp-api-key": self.api_key,
-            "Content-Type": "application/json"
-        }
+    def _build_headers(self, language: str = "en") -> Mapping[str, str]:
+        """Request headers for Viator API (built once per language, read-only)."""
+        headers = self._headers_by_lang.get(language)
+        if headers is None:
+            headers = MappingProxyType({
+                "Accept": "application/json;version=2.0",
+                "Accept-Language": language,
+                "exp-api-key": self.api_key,
+                "Content-Type": "application/json"
+            })
+            self._headers_by_lang[language] = headers
+        return headers
 
     @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
+        stop=stop_after_attempt(MAX_ATTEMPTS),
+        wait=_retry_wait,
         retry=retry_if_exception_type((httpx.RequestError, ViatorRateLimitError)),
         reraise=True
     )
@@ -87,34 +261,53 @@ class ViatorClient:
         url = f"{self.base_url}{endpoint}"
         headers = self._build_headers(language)
 
-        logger.info(f"Viator API request: {method} {endpoint}")
-        logger.debug(f"Full URL: {url}")
+        logger.debug("Viator API request: %s %s", method, endpoint)
+        logger.debug("Full URL: %s", url)
 
-        try:
+        bucket = self._buckets[_longest_prefix(endpoint, self._buckets)]
+
+        async def send() -> httpx.Response:
             response = await self.http_client.request(
                 method=method,
                 url=url,
                 headers=headers,
                 params=params,
-                json=json_data
+                content=orjson.dumps(json_data) if json_data is not None else None
             )
+            # Only server faults count against the breaker (not 4xx/429)
+            if response.status_code >= 500:
+                response.raise_for_status()
+            return response
+
+        try:
+            # Wait for budget here rather than finding out via a 429
+            async with bucket, self._concurrency:
+                response = await self._breaker.call(send)
 
             # Log rate limit headers
             if "RateLimit-Remaining" in response.headers:
-                logger.info(
-                    f"Rate limit: {response.headers['RateLimit-Remaining']}/{response.headers.get('RateLimit-Limit', 'unknown')} remaining"
+                remaining_quota = response.headers["RateLimit-Remaining"]
+                logger.debug(
+                    "Rate limit: %s/%s remaining",
+                    remaining_quota,
+                    response.headers.get("RateLimit-Limit", "unknown"),
                 )
+                if remaining_quota.strip() == "0":
+                    bucket.drain()
 
             # Handle rate limiting
             if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", 60))
+                bucket.drain()
+                retry_after = _parse_retry_after(response.headers.get("Retry-After"))
                 logger.warning(f"Rate limit exceeded, retry after {retry_after}s")
-                raise ViatorRateLimitError(f"Rate limit exceeded, retry after {retry_after}s")
+                raise ViatorRateLimitError(
+                    f"Rate limit exceeded, retry after {retry_after}s", retry_after=retry_after
+                )
 
             # Handle other errors
             response.raise_for_status()
 
-            return response.json()
+            return orjson.loads(response.content)
 
         except httpx.HTTPStatusError as e:
             error_detail = "Unknown error"
@@ -132,9 +325,59 @@ class ViatorClient:
             logger.error(f"Request error to Viator API ({error_type}) on {endpoint}: {error_cause}")
             raise
 
+        except CircuitOpenError as e:
+            logger.warning(f"Viator API unavailable, skipping {method} {endpoint}")
+            raise ViatorAPIError(str(e)) from e
+
+    def _response_cache(self, endpoint: str) -> Optional[LookupCache]:
+        """Response cache for a GET endpoint (longest matching prefix), if any."""
+        prefix = _longest_prefix(endpoint, self.CACHE_TTLS)
+        return self._response_caches.get(prefix) if prefix is not None else None
+
     async def get(self, endpoint: str, params: Optional[dict] = None, language: str = "en") -> dict:
-        """Make GET request to Viator API."""
-        return await self.request("GET", endpoint, params=params, language=language)
+        """
+        Make GET request to Viator API.
+
+        GETs on endpoints listed in CACHE_TTLS are served from an in-process
+        LRU (and Redis when configured); concurrent identical misses share a
+        single request.
+        """
+        return await self.cached(
+            endpoint,
+            lambda: self.request("GET", endpoint, params=params, language=language),
+            params=params,
+            language=language,
+        )
+
+    async def cached(
+        self,
+        endpoint: str,
+        fetch: Callable[[], Awaitable[Any]],
+        params: Optional[dict] = None,
+        language: str = "en"
+    ) -> Any:
+        """
+        Serve a GET-equivalent lookup through the endpoint's response cache.
+
+        ``fetch`` produces the response on a miss, so lookups answered by a
+        bulk endpoint share the cache entries of the single-item GET.
+        Endpoints without a cache TTL always call ``fetch``.
+        """
+        cache = self._response_cache(endpoint)
+        if cache is None:
+            return await fetch()
+
+        key = {
+            "endpoint": endpoint,
+            "params": orjson.dumps(params or {}, option=orjson.OPT_SORT_KEYS).decode(),
+            "language": language,
+        }
+        return await cache.get_or_fetch(key, fetch)
+
+    def clear_response_cache(self) -> None:
+        """Drop in-process cached GET responses."""
+        for cache in self._response_caches.values():
+            cache.clear()
 
     async def post(self, endpoint: str, json_data: dict, language: str = "en") -> dict:
         """Make POST request to Viator API."""
@@ -150,7 +393,11 @@ class ViatorClient:
         Returns:
             Location details dict
         """
-        return await self.get(f"/partner/locations/{location_ref}")
+        # Concurrent lookups share one /partner/locations/bulk request
+        return await self.cached(
+            f"/partner/locations/{location_ref}",
+            lambda: self._location_coalescer.submit(location_ref),
+        )
 
     async def get_bulk_locations(self, location_refs: list[str]) -> list[dict]:
         """
@@ -162,14 +409,22 @@ class ViatorClient:
         Returns:
             List of location objects
         """
-        if not location_refs:
+        # Duplicates would only waste slots in the per-request ref limit
+        refs = list(dict.fromkeys(location_refs))
+        if not refs:
             return []
 
-        logger.info(f"Fetching bulk locations for {len(location_refs)} refs")
-        
-        response = await self.post(
-            "/partner/locations/bulk",
-            json_data={"locations": location_refs}
-        )
-        
-        return response.get("locations", [])
+        logger.debug("Fetching bulk locations for %d refs", len(refs))
+
+        # Chunks go out concurrently; request() applies the rate limit and
+        # concurrency cap
+        size = self.MAX_BULK_LOCATIONS
+        responses = await asyncio.gather(*(
+            self.post(
+                "/partner/locations/bulk",
+                json_data={"locations": refs[i:i + size]}
+            )
+            for i in range(0, len(refs), size)
+        ))
+
+        return [location for response in responses for location in response.get("locations", [])]
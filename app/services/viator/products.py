@@ -3,7 +3,7 @@
 from __future__ import annotations
 import logging
 from typing import Optional
-from .client import ViatorClient
+from .client import BulkCoalescer, ViatorClient
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +13,8 @@ class ViatorProductsService:
 
     def __init__(self, client: ViatorClient):
         self.client = client
+        # language -> coalescer batching single-product lookups into /products/bulk
+        self._product_coalescers: dict[str, BulkCoalescer] = {}
 
     async def search_products(
         self,
@@ -90,11 +92,11 @@ class ViatorProductsService:
             "count": min(count, 50)  # Max 50 per API spec
         }
 
-        logger.info(f"Searching products for destination {destination_id}")
+        logger.debug("Searching products for destination %s", destination_id)
 
         response = await self.client.post("/partner/products/search", request_body, language=language)
 
-        logger.info(f"Found {response.get('totalCount', 0)} products")
+        logger.debug("Found %s products", response.get("totalCount", 0))
 
         return response
 
@@ -109,9 +111,22 @@ class ViatorProductsService:
         Returns:
             Full product details
         """
-        logger.info(f"Fetching product details for {product_code}")
-
-        return await self.client.get(f"/partner/products/{product_code}", language=language)
+        logger.debug("Fetching product details for %s", product_code)
+
+        coalescer = self._product_coalescers.get(language)
+        if coalescer is None:
+            coalescer = BulkCoalescer(
+                lambda codes: self.get_bulk_products(codes, language=language),
+                key_field="productCode",
+            )
+            self._product_coalescers[language] = coalescer
+
+        # Concurrent lookups share one /partner/products/bulk request
+        return await self.client.cached(
+            f"/partner/products/{product_code}",
+            lambda: coalescer.submit(product_code),
+            language=language,
+        )
 
     async def get_bulk_products(self, product_codes: list[str], language: str = "en") -> list[dict]:
         """
@@ -127,7 +142,7 @@ class ViatorProductsService:
         if not product_codes:
             return []
 
-        logger.info(f"Fetching bulk product details for {len(product_codes)} products")
+        logger.debug("Fetching bulk product details for %d products", len(product_codes))
 
         response = await self.client.post(
             "/partner/products/bulk",
@@ -1,21 +1,26 @@
 from __future__ import annotations
+import asyncio
 from typing import Any, Dict, List, Optional
 import httpx
-from datetime import datetime
+import orjson
+
+from app.core.cache import LookupCache
+from app.core.circuit_breaker import CircuitBreaker
+from app.utils.timestamps import utc_now_iso
 
 
 # Query with description AND multiple images (P18)
 # Using GROUP_CONCAT to get up to 3 images
-SPARQL_TEMPLATE = """
-PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+SPARQL_TEMPLATE = """PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
 PREFIX schema: <http://schema.org/>
 PREFIX wdt: <http://www.wikidata.org/prop/direct/>
 PREFIX bd: <http://www.bigdata.com/rdf#>
 PREFIX wikibase: <http://wikiba.se/ontology#>
 
-SELECT ?item ?itemLabel ?itemDescription ?inception ?heritageLabel ?instanceLabel 
+SELECT ?item ?itemLabel ?itemDescription ?inception ?heritageLabel ?instanceLabel
        (GROUP_CONCAT(DISTINCT ?image; separator="|") AS ?images) WHERE {
-  ?item rdfs:label "%s"@en.
+  VALUES ?label { "%s"@en }
+  ?item rdfs:label ?label.
   OPTIONAL { ?item schema:description ?itemDescription. FILTER(LANG(?itemDescription) = "en") }
   OPTIONAL { ?item wdt:P571 ?inception. }
   OPTIONAL { ?item wdt:P1435 ?heritage. }
@@ -24,20 +29,19 @@ SELECT ?item ?itemLabel ?itemDescription ?inception ?heritageLabel ?instanceLabe
   SERVICE wikibase:label { bd:serviceParam wikibase:language "en". }
 }
 GROUP BY ?item ?itemLabel ?itemDescription ?inception ?heritageLabel ?instanceLabel
-LIMIT 1
-"""
+LIMIT 1"""
 
 # French label query
-SPARQL_TEMPLATE_FR = """
-PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+SPARQL_TEMPLATE_FR = """PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
 PREFIX schema: <http://schema.org/>
 PREFIX wdt: <http://www.wikidata.org/prop/direct/>
 PREFIX bd: <http://www.bigdata.com/rdf#>
 PREFIX wikibase: <http://wikiba.se/ontology#>
 
-SELECT ?item ?itemLabel ?itemDescription ?inception ?heritageLabel ?instanceLabel 
+SELECT ?item ?itemLabel ?itemDescription ?inception ?heritageLabel ?instanceLabel
        (GROUP_CONCAT(DISTINCT ?image; separator="|") AS ?images) WHERE {
-  ?item rdfs:label "%s"@fr.
+  VALUES ?label { "%s"@fr }
+  ?item rdfs:label ?label.
   OPTIONAL { ?item schema:description ?itemDescription. FILTER(LANG(?itemDescription) = "en") }
   OPTIONAL { ?item wdt:P571 ?inception. }
   OPTIONAL { ?item wdt:P1435 ?heritage. }
@@ -46,21 +50,27 @@ SELECT ?item ?itemLabel ?itemDescription ?inception ?heritageLabel ?instanceLabe
   SERVICE wikibase:label { bd:serviceParam wikibase:language "en,fr". }
 }
 GROUP BY ?item ?itemLabel ?itemDescription ?inception ?heritageLabel ?instanceLabel
-LIMIT 1
-"""
+LIMIT 1"""
 
-# Fuzzy search with CONTAINS
-SPARQL_TEMPLATE_FUZZY = """
-PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+# Fuzzy search through Wikidata's search index (EntitySearch via MWAPI)
+# instead of a CONTAINS scan over every label
+SPARQL_TEMPLATE_FUZZY = """PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
 PREFIX schema: <http://schema.org/>
 PREFIX wdt: <http://www.wikidata.org/prop/direct/>
 PREFIX bd: <http://www.bigdata.com/rdf#>
 PREFIX wikibase: <http://wikiba.se/ontology#>
+PREFIX mwapi: <https://www.mediawiki.org/ontology#API/>
 
-SELECT ?item ?itemLabel ?itemDescription ?inception ?heritageLabel ?instanceLabel 
+SELECT ?item ?itemLabel ?itemDescription ?inception ?heritageLabel ?instanceLabel
        (GROUP_CONCAT(DISTINCT ?image; separator="|") AS ?images) WHERE {
-  ?item rdfs:label ?label.
-  FILTER(LANG(?label) = "en" && CONTAINS(LCASE(?label), LCASE("%s")))
+  SERVICE wikibase:mwapi {
+    bd:serviceParam wikibase:endpoint "www.wikidata.org";
+                    wikibase:api "EntitySearch";
+                    mwapi:search "%s";
+                    mwapi:language "en";
+                    mwapi:limit "1".
+    ?item wikibase:apiOutputItem mwapi:item.
+  }
   OPTIONAL { ?item schema:description ?itemDescription. FILTER(LANG(?itemDescription) = "en") }
   OPTIONAL { ?item wdt:P571 ?inception. }
   OPTIONAL { ?item wdt:P1435 ?heritage. }
@@ -69,53 +79,118 @@ SELECT ?item ?itemLabel ?itemDescription ?inception ?heritageLabel ?instanceLabe
   SERVICE wikibase:label { bd:serviceParam wikibase:language "en". }
 }
 GROUP BY ?item ?itemLabel ?itemDescription ?inception ?heritageLabel ?instanceLabel
-LIMIT 1
-"""
+LIMIT 1"""
+
+
+# Backslash escapes for characters that cannot appear raw in a SPARQL "..." literal
+_SPARQL_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+
+
+def _render(template: str, label: str) -> str:
+    """Substitute an escaped label into a SPARQL template."""
+    return template.replace("%s", label.translate(_SPARQL_ESCAPES))
+
+
+# Shared stand-in for absent bindings (never mutated)
+_EMPTY: Dict[str, Any] = {}
+
+
+def _value(binding: Dict[str, Any], key: str) -> Optional[str]:
+    """Plain value of a SPARQL result binding, or None when unbound."""
+    return binding.get(key, _EMPTY).get("value")
 
 
 class WikidataClient:
     MAX_IMAGES = 3  # Maximum number of images to return
-    
-    def __init__(self, user_agent: str, http_client: httpx.AsyncClient):
+    RESULT_TTL_SECONDS = 7 * 86400  # Wikidata facts change slowly
+
+    def __init__(
+        self,
+        user_agent: str,
+        http_client: httpx.AsyncClient,
+        max_concurrency: int = 5,
+        redis_cache: Optional[Any] = None,
+    ):
         self.user_agent = user_agent
-        self.http = http_client or httpx.AsyncClient()
+        self.http = http_client or httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        self._headers = {
+            "Accept": "application/sparql-results+json",
+            "User-Agent": user_agent,
+            "Content-Type": "application/sparql-query",
+        }
+        # Cap on in-flight requests to query.wikidata.org (its per-IP limit is 5)
+        self._concurrency = asyncio.Semaphore(max_concurrency)
+        # While WDQS is failing, skip SPARQL calls instead of waiting out timeouts
+        self._breaker = CircuitBreaker("wikidata", fail_max=10, reset_timeout=30.0)
+        # Found entities survive restarts via Redis; concurrent enrichments of
+        # the same POI share one in-flight lookup
+        self._results = LookupCache("wikidata", self.RESULT_TTL_SECONDS, redis_cache)
 
     async def fetch(self, poi_name: str, city: str) -> Optional[Dict[str, Any]]:
-        headers = {"Accept": "application/sparql-results+json", "User-Agent": self.user_agent}
-        
-        # Strategy 1: Exact match on POI name (English)
-        result = await self._try_query(SPARQL_TEMPLATE % poi_name, headers)
-        if result and result.get("description"):
-            return result
-        
-        # Strategy 2: Try French label (for French POI names like "Tour Eiffel")
-        result_fr = await self._try_query(SPARQL_TEMPLATE_FR % poi_name, headers)
-        if result_fr and result_fr.get("description"):
-            return result_fr
-        
-        # Strategy 3: Try with city in parentheses
-        result = await self._try_query(SPARQL_TEMPLATE % f"{poi_name} ({city})", headers)
-        if result and result.get("description"):
-            return result
+        # Labels match case-sensitively, so only whitespace is normalized
+        poi_name = " ".join(poi_name.split())
+        city = " ".join(city.split())
+        return await self._results.get_or_fetch(
+            {"poi": poi_name, "city": city}, lambda: self._fetch(poi_name, city)
+        )
+
+    async def _fetch(self, poi_name: str, city: str) -> Optional[Dict[str, Any]]:
+        # Strategies 1-3 run concurrently but are checked in priority order:
+        # 1. Exact match on POI name (English)
+        # 2. French label (for French POI names like "Tour Eiffel")
+        # 3. POI name with city in parentheses
+        queries = (
+            _render(SPARQL_TEMPLATE, poi_name),
+            _render(SPARQL_TEMPLATE_FR, poi_name),
+            _render(SPARQL_TEMPLATE, f"{poi_name} ({city})"),
+        )
+        # Tasks own their requests (no shared/shielded work), so cancelling a
+        # losing strategy aborts its HTTP call and frees its concurrency slot
+        tasks = [asyncio.ensure_future(self._run_query(query)) for query in queries]
+        try:
+            results = []
+            for task in tasks:
+                result = await task
+                if result and result.get("description"):
+                    return result
+                results.append(result)
+        finally:
+            # Lower-priority strategies are not needed once one has won
+            for task in tasks:
+                task.cancel()
         
-        # Strategy 4: Fuzzy search with CONTAINS
-        result = await self._try_query(SPARQL_TEMPLATE_FUZZY % poi_name, headers)
-        if result:
-            return result
+        # Return best result we found even without description: the fuzzy
+        # search is the loosest match, so it is only a last resort
+        exact, result_fr, with_city = results
+        if result_fr or exact or with_city:
+            return result_fr or exact or with_city
         
-        # Return best result we found even without description
-        return result_fr or result
+        # Strategy 4: Fuzzy search (Wikidata search index)
+        return await self._run_query(_render(SPARQL_TEMPLATE_FUZZY, poi_name))
 
-    async def _try_query(self, query: str, headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
-        try:
-            response = await self.http.get(
+    async def _run_query(self, query: str) -> Optional[Dict[str, Any]]:
+        async def send() -> httpx.Response:
+            # Raw query body: no URL length limit (no 414s) and no form encoding
+            response = await self.http.post(
                 "https://query.wikidata.org/sparql",
-                params={"query": query},
-                headers=headers,
+                content=query.encode(),
+                headers=self._headers,
                 timeout=10.0,
             )
+            # Only server faults count against the breaker
+            if response.status_code >= 500:
+                response.raise_for_status()
+            return response
+
+        try:
+            async with self._concurrency:
+                response = await self._breaker.call(send)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             bindings = data.get("results", {}).get("bindings", [])
             if bindings:
                 return self._normalize(bindings[0])
@@ -124,7 +199,7 @@ class WikidataClient:
         return None
 
     def _normalize(self, binding: Dict[str, Any]) -> Dict[str, Any]:
-        inception = binding.get("inception", {}).get("value")
+        inception = _value(binding, "inception")
         year_built = None
         if inception:
             try:
@@ -133,27 +208,27 @@ class WikidataClient:
                 year_built = None
         
         # Get real description from schema:description
-        description = binding.get("itemDescription", {}).get("value")
-        label = binding.get("itemLabel", {}).get("value")
+        description = _value(binding, "itemDescription")
+        label = _value(binding, "itemLabel")
         
         if not description or description == label:
             description = None
         
         # 📸 Get up to 3 Wikimedia Commons image URLs
-        images_str = binding.get("images", {}).get("value", "")
+        images_str = _value(binding, "images")
         image_urls: List[str] = []
         if images_str:
-            all_images = [url.strip() for url in images_str.split("|") if url.strip()]
-            image_urls = all_images[:self.MAX_IMAGES]  # Limit to 3
+            stripped = (url.strip() for url in images_str.split("|"))
+            image_urls = [url for url in stripped if url][:self.MAX_IMAGES]  # Limit to 3
         
         return {
             "year_built": year_built,
             "unesco_site": bool(binding.get("heritageLabel")),
-            "instance_of": binding.get("instanceLabel", {}).get("value"),
+            "instance_of": _value(binding, "instanceLabel"),
             "description": description,
             "image_urls": image_urls,  # List of up to 3 Wikimedia Commons images
         }
 
     @staticmethod
     def source_meta(fields: list[str]) -> Dict[str, Any]:
-        return {"name": "wikidata", "last_fetched": datetime.utcnow().isoformat(), "fields": fields}
+        return {"name": "wikidata", "last_fetched": utc_now_iso(), "fields": fields}
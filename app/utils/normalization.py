@@ -1,12 +1,26 @@
 import re
+import string
 from typing import Any
 
+# Runs of anything but [a-z0-9] ("-" included, so dashes never repeat)
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_DASH_RUN_RE = re.compile(r"-{2,}")
+
+# ASCII fast path: every non-[a-z0-9] character becomes "-" in one C-level pass
+_SLUG_KEEP = frozenset(string.ascii_lowercase + string.digits)
+_SLUG_TABLE = str.maketrans({
+    code: chr(code) if chr(code) in _SLUG_KEEP else "-" for code in range(128)
+})
+
 
 def slugify(value: str) -> str:
     value = value.strip().lower()
-    value = re.sub(r"[^a-z0-9]+", "-", value)
-    value = re.sub(r"-+", "-", value).strip("-")
-    return value
+    if not value.isascii():
+        return _NON_ALNUM_RE.sub("-", value).strip("-")
+    value = value.translate(_SLUG_TABLE)
+    if "--" in value:
+        value = _DASH_RUN_RE.sub("-", value)
+    return value.strip("-")
 
 
 def build_poi_key(poi_name: str, city: str) -> str:
@@ -15,7 +29,16 @@ def build_poi_key(poi_name: str, city: str) -> str:
 
 def merge_dicts(primary: dict[str, Any], secondary: dict[str, Any]) -> dict[str, Any]:
     merged = {**secondary, **primary}
-    for key, value in secondary.items():
-        if isinstance(value, dict) and isinstance(primary.get(key), dict):
-            merged[key] = merge_dicts(primary[key], value)
+    # Nested dict-vs-dict collisions are merged with an explicit stack
+    # (no recursion); every other key is already settled by the splat above
+    stack = [(merged, primary, secondary)]
+    while stack:
+        target, first, second = stack.pop()
+        for key, value in second.items():
+            if isinstance(value, dict):
+                preferred = first.get(key)
+                if isinstance(preferred, dict):
+                    nested = {**value, **preferred}
+                    target[key] = nested
+                    stack.append((nested, preferred, value))
     return merged
@@ -0,0 +1,26 @@
+"""Cheap UTC timestamps for provenance metadata."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+
+# Refresh the formatted timestamp at most once per second
+_TS_GRANULARITY_SECONDS = 1.0
+
+# [computed_at, formatted] - refreshed lazily by utc_now_iso()
+_TS_CACHE: list = [0.0, ""]
+
+
+def utc_now_iso() -> str:
+    """
+    Return the current UTC time as a naive ISO-8601 string.
+
+    Same format as ``datetime.utcnow().isoformat()``, but the string is only
+    re-formatted once per second so bulk enrichment does not pay the cost
+    for every POI.
+    """
+    now = time.time()
+    if now - _TS_CACHE[0] > _TS_GRANULARITY_SECONDS:
+        _TS_CACHE[:] = [now, datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None).isoformat()]
+    return _TS_CACHE[1]
@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Iterator, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Image variant size buckets: heights up to 200px are small, up to 600px medium
+_SMALL_MAX_HEIGHT = 200
+_MEDIUM_MAX_HEIGHT = 600
+_VARIANT_BUCKETS = ("small", "medium", "large")
+
+# Shared read-only defaults for missing keys (never mutated or returned)
+_EMPTY_DICT: dict = {}
+_EMPTY_LIST: tuple = ()
+
 
 class ViatorMapper:
     """Transform Viator API responses to simplified format for frontend."""
@@ -21,47 +31,47 @@ class ViatorMapper:
         Returns:
             Simplified activity dict
         """
+        get = product.get
+
         # Extract images
         images = []
-        if product.get("images"):
-            for img in product["images"]:
-                variants = {}
-                if img.get("variants"):
-                    for variant in img["variants"]:
-                        height = variant.get("height", 0)
-                        if height <= 200:
-                            variants["small"] = variant["url"]
-                        elif height <= 600:
-                            variants["medium"] = variant["url"]
-                        else:
-                            variants["large"] = variant["url"]
-
-                images.append({
-                    "url": img["variants"][0]["url"] if img.get("variants") else "",
-                    "is_cover": img.get("isCover", False),
-                    "variants": variants
-                })
+        for img in get("images") or _EMPTY_LIST:
+            img_variants = img.get("variants")
+            variants = {}
+            for variant in img_variants or _EMPTY_LIST:
+                # Bucket index is the number of thresholds exceeded; later
+                # variants of the same size bucket win
+                height = variant.get("height", 0)
+                bucket = _VARIANT_BUCKETS[(height > _SMALL_MAX_HEIGHT) + (height > _MEDIUM_MAX_HEIGHT)]
+                variants[bucket] = variant["url"]
+
+            images.append({
+                "url": img_variants[0]["url"] if img_variants else "",
+                "is_cover": img.get("isCover", False),
+                "variants": variants
+            })
 
         # Extract pricing
-        pricing_info = product.get("pricing", {})
-        pricing_summary = pricing_info.get("summary", {})
+        pricing_info = get("pricing") or _EMPTY_DICT
+        pricing_summary = pricing_info.get("summary") or _EMPTY_DICT
+        original_price = pricing_summary.get("fromPriceBeforeDiscount")
 
         pricing = {
             "from_price": pricing_summary.get("fromPrice", 0),
             "currency": pricing_info.get("currency", "EUR"),
-            "original_price": pricing_summary.get("fromPriceBeforeDiscount"),
-            "is_discounted": pricing_summary.get("fromPriceBeforeDiscount") is not None
+            "original_price": original_price,
+            "is_discounted": original_price is not None
         }
 
         # Extract rating
-        reviews = product.get("reviews", {})
+        reviews = get("reviews") or _EMPTY_DICT
         rating = {
             "average": reviews.get("combinedAverageRating", 0),
             "count": reviews.get("totalReviews", 0)
         }
 
         # Extract duration
-        duration_obj = product.get("duration", {})
+        duration_obj = get("duration") or _EMPTY_DICT
         duration_minutes = duration_obj.get("fixedDurationInMinutes", 0)
 
         duration = {
@@ -70,8 +80,8 @@ class ViatorMapper:
         }
 
         # Extract destination
-        destinations = product.get("destinations", [])
-        primary_dest = destinations[0] if destinations else {}
+        destinations = get("destinations")
+        primary_dest = destinations[0] if destinations else _EMPTY_DICT
         destination_id = primary_dest.get("ref") if primary_dest else None
 
         location = {
@@ -82,27 +92,40 @@ class ViatorMapper:
         }
 
         # Extract categories (tags → simple category names)
-        tags = product.get("tags", [])
-        categories = ViatorMapper._map_tags_to_categories(tags)
+        categories = ViatorMapper._map_tags_to_categories(get("tags"))
 
         # Build simplified activity
         return {
-            "id": product.get("productCode"),
-            "title": product.get("title", ""),
-            "description": product.get("description", ""),
+            "id": get("productCode"),
+            "title": get("title", ""),
+            "description": get("description", ""),
             "images": images,
             "pricing": pricing,
             "rating": rating,
             "duration": duration,
             "categories": categories,
-            "flags": product.get("flags", []),
-            "booking_url": product.get("productUrl", ""),
-            "confirmation_type": product.get("confirmationType", "UNKNOWN"),
+            "flags": get("flags", []),
+            "booking_url": get("productUrl", ""),
+            "confirmation_type": get("confirmationType", "UNKNOWN"),
             "location": location,
             "availability": "available",  # Default - would need /availability/check for real status
             "_destination_id": destination_id  # Internal field for enrichment fallback
         }
 
+    @staticmethod
+    def map_products(products: list[dict]) -> list[dict]:
+        """
+        Transform a list of Viator ProductSummaries (see map_product_summary).
+
+        Args:
+            products: ProductSummary list from a Viator search response
+
+        Returns:
+            Simplified activity dicts, in order
+        """
+        map_one = ViatorMapper.map_product_summary
+        return [map_one(product) for product in products]
+
     @staticmethod
     def map_attraction(attraction: dict) -> dict:
         """
@@ -193,8 +216,9 @@ class ViatorMapper:
         }
 
     @staticmethod
+    @lru_cache(maxsize=512)
     def _format_duration(minutes: int) -> str:
-        """Format duration in minutes to human-readable string."""
+        """Format duration in minutes to human-readable string (memoized: few distinct values)."""
         if minutes == 0:
             return "Flexible"
 
@@ -240,7 +264,7 @@ class ViatorMapper:
         locations = []
         seen_refs = set()
 
-        def _add_loc(obj, source="unknown"):
+        for source, obj in ViatorMapper._iter_location_objects(product):
             loc_data = obj.get("location", {})
             ref = loc_data.get("ref")
 
@@ -256,48 +280,55 @@ class ViatorMapper:
                 lon = center.get("longitude") or center.get("lon")
 
             if not ref and not (lat and lon):
-                return
-
-            if ref in seen_refs:
-                return
+                continue
 
+            # Coordinate-only entries (no ref) are never deduplicated
             if ref:
+                if ref in seen_refs:
+                    continue
                 seen_refs.add(ref)
 
-            loc_info = {
+            locations.append({
                 "ref": ref,
                 "lat": lat,
                 "lon": lon
-            }
-            locations.append(loc_info)
-            logger.info(f"[MAPPER] {product_code} - Found location from {source}: ref={ref}, coords={'Yes' if (lat and lon) else 'No'}")
+            })
+            logger.debug(
+                "[MAPPER] %s - Found location from %s: ref=%s, coords=%s",
+                product_code, source, ref, "Yes" if (lat and lon) else "No",
+            )
+
+        logger.info("[MAPPER] %s - Total locations extracted: %d", product_code, len(locations))
+        return locations
+
+    @staticmethod
+    def _iter_location_objects(product: dict) -> Iterator[Tuple[str, dict]]:
+        """Yield (source, object) for every place a product can carry a location."""
+        product_code = product.get("productCode", "UNKNOWN")
 
         # Check logistics start/end
         logistics = product.get("logistics", {})
-        start_points = logistics.get("start", [])
-        end_points = logistics.get("end", [])
+        start_points = logistics.get("start", ())
+        end_points = logistics.get("end", ())
 
-        logger.info(f"[MAPPER] {product_code} - Logistics: {len(start_points)} start points, {len(end_points)} end points")
+        logger.debug(
+            "[MAPPER] %s - Logistics: %d start points, %d end points",
+            product_code, len(start_points), len(end_points),
+        )
 
         for start_point in start_points:
-            _add_loc(start_point, "logistics.start")
+            yield "logistics.start", start_point
         for end_point in end_points:
-            _add_loc(end_point, "logistics.end")
+            yield "logistics.end", end_point
 
         # Check itinerary points of interest
-        itinerary = product.get("itinerary", {})
-        days = itinerary.get("days", [])
-
+        days = product.get("itinerary", {}).get("days", ())
         if days:
-            logger.info(f"[MAPPER] {product_code} - Itinerary: {len(days)} days")
-            for day_idx, day in enumerate(days):
-                items = day.get("items", [])
-                for item in items:
-                    point_of_interest = item.get("pointOfInterest", {})
-                    _add_loc(point_of_interest, f"itinerary.day{day_idx+1}")
-
-        logger.info(f"[MAPPER] {product_code} - Total locations extracted: {len(locations)}")
-        return locations
+            logger.debug("[MAPPER] %s - Itinerary: %d days", product_code, len(days))
+        for day_idx, day in enumerate(days, 1):
+            source = f"itinerary.day{day_idx}"
+            for item in day.get("items", ()):
+                yield source, item.get("pointOfInterest", {})
 
     @staticmethod
     def extract_location_refs(product: dict) -> list[str]:
@@ -7,7 +7,8 @@ This fixes the MongoDB 2dsphere index error:
 
 import asyncio
 import logging
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient, UpdateOne
+from pymongo.errors import BulkWriteError
 import os
 from dotenv import load_dotenv
 
@@ -19,10 +20,30 @@ logger = logging.getLogger(__name__)
 
 MONGODB_URL = os.getenv("MONGODB_URL")
 
+# Updates sent per bulk_write round-trip
+BATCH_SIZE = 1000
+
+
+async def flush_updates(collection, ops: list) -> tuple[int, int]:
+    """Send queued updates in one unordered bulk write; returns (modified, errors)."""
+    if not ops:
+        return 0, 0
+    try:
+        result = await collection.bulk_write(ops, ordered=False)
+        return result.modified_count, 0
+    except BulkWriteError as e:
+        # Unordered: the other updates in the batch were still applied
+        details = e.details
+        for error in details.get("writeErrors", [])[:5]:
+            logger.error(f"✗ Bulk update error: {error.get('errmsg')}")
+        return details.get("nModified", 0), len(details.get("writeErrors", []))
+
+
 async def migrate_attractions():
     """Migrate all attractions coordinates to GeoJSON format."""
 
-    client = AsyncIOMotorClient(MONGODB_URL)
+    # Native asyncio driver: no thread-pool hop per operation as with Motor
+    client = AsyncMongoClient(MONGODB_URL)
     db = client.travliaq
     collection = db.attractions
 
@@ -34,15 +55,18 @@ async def migrate_attractions():
         "location.coordinates.lon": {"$exists": True}
     }
 
-    cursor = collection.find(query)
-    attractions = await cursor.to_list(length=None)
-
-    logger.info(f"Found {len(attractions)} attractions with old coordinate format")
+    # Stream documents so updates start flowing before the scan finishes
+    # Only the fields the conversion reads travel over the wire
+    projection = {"_id": 1, "location.coordinates": 1, "attraction_id": 1, "product_code": 1}
+    cursor = collection.find(query, projection=projection).batch_size(500)
 
+    total = 0
     converted = 0
     errors = 0
+    ops = []
 
-    for attraction in attractions:
+    async for attraction in cursor:
+        total += 1
         try:
             attraction_id = attraction.get("attraction_id") or attraction.get("product_code")
             coords = attraction["location"]["coordinates"]
@@ -52,32 +76,31 @@ async def migrate_attractions():
                 lon = coords["lon"]
 
                 # Convert to GeoJSON: [longitude, latitude]
-                new_coords = [lon, lat]
-
-                # Update in database
-                result = await collection.update_one(
+                ops.append(UpdateOne(
                     {"_id": attraction["_id"]},
-                    {"$set": {"location.coordinates": new_coords}}
-                )
-
-                if result.modified_count > 0:
-                    converted += 1
-                    logger.info(
-                        f"✓ Converted {attraction_id}: "
-                        f"{{lat: {lat}, lon: {lon}}} → [{lon}, {lat}]"
-                    )
-                else:
-                    logger.warning(f"⚠️  No change for {attraction_id}")
+                    {"$set": {"location.coordinates": [lon, lat]}}
+                ))
 
         except Exception as e:
             errors += 1
             logger.error(f"✗ Error converting {attraction_id}: {e}")
 
+        if len(ops) >= BATCH_SIZE:
+            modified, failed = await flush_updates(collection, ops)
+            converted += modified
+            errors += failed
+            ops = []
+            logger.info(f"Converted {converted} attractions so far...")
+
+    modified, failed = await flush_updates(collection, ops)
+    converted += modified
+    errors += failed
+
     logger.info("="*80)
     logger.info("Migration Complete:")
     logger.info(f"  Converted: {converted}")
     logger.info(f"  Errors: {errors}")
-    logger.info(f"  Total: {len(attractions)}")
+    logger.info(f"  Total: {total}")
     logger.info("="*80)
 
     # Verify: Count attractions with GeoJSON format
@@ -87,7 +110,7 @@ async def migrate_attractions():
 
     logger.info(f"Attractions with GeoJSON coordinates: {geojson_count}")
 
-    client.close()
+    await client.close()
 
 if __name__ == "__main__":
     asyncio.run(migrate_attractions())
@@ -21,11 +21,10 @@ import json
 import os
 import re
 import sys
-import time
 from datetime import datetime
 from pathlib import Path
 
-import requests
+import httpx
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -44,9 +43,12 @@ SUPABASE_BUCKET = "Country"
 STORAGE_MODE = "supabase"
 LOCAL_IMAGES_DIR = Path(__file__).parent / "generated_images"
 
-BATCH_SIZE = 10
-PAUSE_BETWEEN_REQUESTS = 3  # seconds
-PROGRESS_FILE = Path(__file__).parent / "country_images_progress.json"
+# Max image generations in flight at once (sized to the provider's rate limit)
+CONCURRENCY = 10
+# Append-only log: one JSON line per processed country
+PROGRESS_FILE = Path(__file__).parent / "country_images_progress.jsonl"
+# Snapshot written by older versions of this script, still honoured on resume
+LEGACY_PROGRESS_FILE = Path(__file__).parent / "country_images_progress.json"
 
 
 # ============================================================================
@@ -373,11 +375,11 @@ NO composites, NO multiple landmarks merged together, NO artistic interpretation
 Just a simple, beautiful, realistic travel photo of {country_name}."""
 
 
-def generate_image_openrouter(country_name: str, landmark_prompt: str) -> str:
-    """Generate an image via OpenRouter/Flux 2 Pro. Returns base64 data."""
+async def generate_image_openrouter(http: httpx.AsyncClient, country_name: str, landmark_prompt: str) -> bytes:
+    """Generate an image via OpenRouter/Flux 2 Pro. Returns the PNG bytes."""
     prompt = generate_prompt(country_name, landmark_prompt)
 
-    response = requests.post(
+    response = await http.post(
         url="https://openrouter.ai/api/v1/chat/completions",
         headers={
             "Authorization": f"Bearer {OPENROUTER_API_KEY}",
@@ -402,10 +404,9 @@ def generate_image_openrouter(country_name: str, landmark_prompt: str) -> str:
         message = result["choices"][0]["message"]
         if message.get("images"):
             image_data = message["images"][0]["image_url"]["url"]
-            # Extract base64 from "data:image/png;base64,..."
+            # Decode "data:image/png;base64,..." once; callers work with raw bytes
             if image_data.startswith("data:"):
-                base64_data = image_data.split(",")[1]
-                return base64_data
+                return base64.b64decode(image_data.partition(",")[2])
 
     # Check for errors
     if result.get("error"):
@@ -419,11 +420,10 @@ def sanitize_filename(name: str) -> str:
     return re.sub(r'[^\w\s-]', '', name).strip().replace(' ', '_')
 
 
-def save_image_locally(base64_data: str, country_code: str, country_name: str) -> str:
+def save_image_locally(image_bytes: bytes, country_code: str, country_name: str) -> str:
     """Save an image locally. Returns the file path."""
     LOCAL_IMAGES_DIR.mkdir(exist_ok=True)
 
-    image_bytes = base64.b64decode(base64_data)
     safe_name = sanitize_filename(country_name)
     filename = f"{country_code}_{safe_name}_ai_generated.png"
     filepath = LOCAL_IMAGES_DIR / filename
@@ -434,9 +434,8 @@ def save_image_locally(base64_data: str, country_code: str, country_name: str) -
     return str(filepath.absolute())
 
 
-def upload_to_supabase(base64_data: str, country_code: str) -> str:
-    """Upload an image to Supabase Storage. Returns the public URL."""
-    image_bytes = base64.b64decode(base64_data)
+async def upload_to_supabase(http: httpx.AsyncClient, image_bytes: bytes, country_code: str) -> str:
+    """Upload raw PNG bytes to Supabase Storage. Returns the public URL."""
     filename = f"{country_code}_ai_generated.png"
 
     url = f"{SUPABASE_URL}/storage/v1/object/{SUPABASE_BUCKET}/{filename}"
@@ -447,7 +446,7 @@ def upload_to_supabase(base64_data: str, country_code: str) -> str:
         "x-upsert": "true"  # Replace if exists
     }
 
-    response = requests.post(url, headers=headers, data=image_bytes, timeout=60)
+    response = await http.post(url, headers=headers, content=image_bytes, timeout=60)
 
     if response.status_code in [200, 201]:
         public_url = f"{SUPABASE_URL}/storage/v1/object/public/{SUPABASE_BUCKET}/{filename}"
@@ -457,17 +456,30 @@ def upload_to_supabase(base64_data: str, country_code: str) -> str:
 
 
 def load_progress() -> dict:
-    """Load progress from file."""
+    """Rebuild progress from the legacy snapshot and the append-only log."""
+    progress = {"completed": [], "failed": [], "skipped": []}
+    if LEGACY_PROGRESS_FILE.exists():
+        with open(LEGACY_PROGRESS_FILE, 'r') as f:
+            progress = json.load(f)
+
     if PROGRESS_FILE.exists():
         with open(PROGRESS_FILE, 'r') as f:
-            return json.load(f)
-    return {"completed": [], "failed": [], "skipped": []}
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Torn last line after a crash
+                progress[record["status"]].append(record["entry"])
+    return progress
 
 
-def save_progress(progress: dict):
-    """Save progress to file."""
-    with open(PROGRESS_FILE, 'w') as f:
-        json.dump(progress, f, indent=2)
+def record_progress(progress: dict, status: str, entry):
+    """Record one country's outcome in memory and append it durably to the log."""
+    progress[status].append(entry)
+    with open(PROGRESS_FILE, 'a') as f:
+        f.write(json.dumps({"status": status, "entry": entry}) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
 
 
 async def update_country_images():
@@ -509,7 +521,7 @@ async def update_country_images():
     print(f"Storage: {STORAGE_MODE.upper()}")
     print(f"Total to generate: {total}")
     print(f"Already completed: {len(completed)}")
-    print(f"Batch size: {BATCH_SIZE}")
+    print(f"Concurrency: {CONCURRENCY}")
     print(f"{'='*60}\n")
 
     if total == 0:
@@ -519,36 +531,36 @@ async def update_country_images():
 
     processed = 0
     errors = 0
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def process_country(i: int, code: str, prompt: str, description: str, http: httpx.AsyncClient):
+        nonlocal processed, errors
 
-    for i, (code, (prompt, description)) in enumerate(countries_to_process):
         # Get country name from database
         profile = await collection.find_one({"country_code": code})
         if not profile:
             print(f"[{i+1}/{total}] {code}: Profile not found in DB - SKIPPING")
-            progress["skipped"].append(code)
-            save_progress(progress)
-            continue
+            record_progress(progress, "skipped", code)
+            return
 
         country_name = profile.get("country_name", code)
-
-        print(f"[{i+1}/{total}] {country_name} ({code})")
-        print(f"         Landmark: {description}")
+        tag = f"[{i+1}/{total}] {country_name} ({code})"
 
         try:
-            # Generate image
-            print(f"         -> Generating via Flux 1.1 Pro...")
-            base64_data = generate_image_openrouter(country_name, prompt)
-
-            # Save/upload image
-            if STORAGE_MODE == "supabase":
-                print(f"         -> Uploading to Supabase...")
-                image_url = upload_to_supabase(base64_data, code)
-            else:
-                print(f"         -> Saving locally...")
-                image_url = save_image_locally(base64_data, code, country_name)
+            async with semaphore:
+                # Generate image
+                print(f"{tag} -> Generating via Flux 1.1 Pro ({description})...")
+                image_bytes = await generate_image_openrouter(http, country_name, prompt)
+
+                # Save/upload image
+                if STORAGE_MODE == "supabase":
+                    print(f"{tag} -> Uploading to Supabase...")
+                    image_url = await upload_to_supabase(http, image_bytes, code)
+                else:
+                    print(f"{tag} -> Saving locally...")
+                    image_url = save_image_locally(image_bytes, code, country_name)
 
             # Update MongoDB
-            print(f"         -> Updating MongoDB...")
             await collection.update_one(
                 {"country_code": code},
                 {"$set": {
@@ -561,36 +573,26 @@ async def update_country_images():
             )
 
             # Mark as completed
-            progress["completed"].append(code)
-            save_progress(progress)
+            record_progress(progress, "completed", code)
 
-            print(f"         -> OK: {image_url[:60]}...")
+            print(f"{tag} -> OK: {image_url[:60]}...")
             processed += 1
 
         except Exception as e:
-            print(f"         -> ERROR: {e}")
-            progress["failed"].append({
+            print(f"{tag} -> ERROR: {e}")
+            record_progress(progress, "failed", {
                 "code": code,
                 "name": country_name,
                 "error": str(e)
             })
-            save_progress(progress)
             errors += 1
 
-        # Pause between requests
-        if i + 1 < total:
-            print(f"         -> Waiting {PAUSE_BETWEEN_REQUESTS}s...")
-            time.sleep(PAUSE_BETWEEN_REQUESTS)
-
-        # Pause after each batch
-        if (i + 1) % BATCH_SIZE == 0 and i + 1 < total:
-            print(f"\n{'='*60}")
-            print(f"Batch completed ({BATCH_SIZE} images)")
-            print(f"Progress: {i+1}/{total}")
-            print(f"Pausing 10s before next batch...")
-            print(f"(Press Ctrl+C to stop and resume later)")
-            print(f"{'='*60}\n")
-            time.sleep(10)
+    # One client for every call so TCP/TLS connections are reused
+    async with httpx.AsyncClient(http2=True) as http:
+        await asyncio.gather(*(
+            process_country(i, code, prompt, description, http)
+            for i, (code, (prompt, description)) in enumerate(countries_to_process)
+        ))
 
     # Summary
     print(f"\n{'='*60}")
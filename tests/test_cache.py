@@ -0,0 +1,157 @@
+"""
+Tests for the in-process caches in app.core.cache.
+
+Covers SimpleCache LRU eviction, SingleFlight request collapsing and
+LookupCache L1/L2 behaviour with a dict-backed stand-in for RedisCache —
+no Redis needed.
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.cache import LookupCache, SimpleCache, SingleFlight
+
+
+class FakeRedisCache:
+    """Minimal stand-in exposing RedisCache's get_or_set_async signature."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get_or_set_async(self, prefix, params, factory, ttl_seconds=86400):
+        key = (prefix, tuple(sorted(params.items())))
+        if key in self.store:
+            return self.store[key]
+        data = await factory()
+        if data is not None:
+            self.store[key] = data
+        return data
+
+
+class TestSimpleCacheLRU(unittest.TestCase):
+
+    def test_unbounded_by_default(self):
+        cache = SimpleCache()
+        for i in range(100):
+            cache.set(str(i), i, 60)
+        self.assertEqual(cache.get("0"), 0)
+
+    def test_evicts_least_recently_used(self):
+        cache = SimpleCache(max_entries=2)
+        cache.set("a", 1, 60)
+        cache.set("b", 2, 60)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3, 60)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_hit_miss_counters(self):
+        cache = SimpleCache()
+        cache.set("a", 1, 60)
+        cache.get("a")
+        cache.get("missing")
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "done"
+
+        async def run():
+            return await asyncio.gather(*[flight.run("key", work) for _ in range(5)])
+
+        self.assertEqual(asyncio.run(run()), ["done"] * 5)
+        self.assertEqual(len(calls), 1)
+
+    def test_key_released_after_completion(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            return len(calls)
+
+        async def run():
+            first = await flight.run("key", work)
+            second = await flight.run("key", work)
+            return first, second
+
+        self.assertEqual(asyncio.run(run()), (1, 2))
+
+    def test_exception_propagates_to_all_callers(self):
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        async def run():
+            return await asyncio.gather(
+                *[flight.run("key", work) for _ in range(3)], return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+
+
+class TestLookupCache(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = 0
+
+    async def _fetch(self):
+        self.calls += 1
+        return {"name": "Louvre"}
+
+    async def _fetch_none(self):
+        self.calls += 1
+        return None
+
+    def test_memory_hit_skips_fetch(self):
+        cache = LookupCache("test", 60)
+
+        async def run():
+            await cache.get_or_fetch({"q": "louvre"}, self._fetch)
+            return await cache.get_or_fetch({"q": "louvre"}, self._fetch)
+
+        self.assertEqual(asyncio.run(run()), {"name": "Louvre"})
+        self.assertEqual(self.calls, 1)
+
+    def test_redis_shared_between_instances(self):
+        redis = FakeRedisCache()
+        first = LookupCache("test", 60, redis)
+        second = LookupCache("test", 60, redis)
+
+        async def run():
+            await first.get_or_fetch({"q": "louvre"}, self._fetch)
+            return await second.get_or_fetch({"q": "louvre"}, self._fetch)
+
+        self.assertEqual(asyncio.run(run()), {"name": "Louvre"})
+        self.assertEqual(self.calls, 1)
+
+    def test_none_results_are_not_cached(self):
+        cache = LookupCache("test", 60)
+
+        async def run():
+            await cache.get_or_fetch({"q": "nowhere"}, self._fetch_none)
+            await cache.get_or_fetch({"q": "nowhere"}, self._fetch_none)
+
+        asyncio.run(run())
+        self.assertEqual(self.calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
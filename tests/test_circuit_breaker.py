@@ -0,0 +1,77 @@
+"""
+Tests for the CircuitBreaker in app.core.circuit_breaker.
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+async def ok():
+    return "ok"
+
+
+async def boom():
+    raise ConnectionError("down")
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def fail(self, breaker, times):
+        for _ in range(times):
+            with self.assertRaises(ConnectionError):
+                asyncio.run(breaker.call(boom))
+
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker("test", fail_max=3, reset_timeout=60)
+        self.fail(breaker, 3)
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(CircuitOpenError):
+            asyncio.run(breaker.call(ok))
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker("test", fail_max=3, reset_timeout=60)
+        self.fail(breaker, 2)
+        asyncio.run(breaker.call(ok))
+        self.fail(breaker, 2)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_half_open_trial_closes_or_reopens(self):
+        breaker = CircuitBreaker("test", fail_max=1, reset_timeout=0)
+        self.fail(breaker, 1)
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertEqual(asyncio.run(breaker.call(ok)), "ok")
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+        breaker.reset_timeout = 60
+        self.fail(breaker, 1)
+        breaker._opened_at -= 60
+        self.fail(breaker, 1)
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+    def test_half_open_allows_single_trial(self):
+        breaker = CircuitBreaker("test", fail_max=1, reset_timeout=0)
+        self.fail(breaker, 1)
+
+        async def slow():
+            await asyncio.sleep(0.01)
+            return "ok"
+
+        async def run():
+            return await asyncio.gather(
+                breaker.call(slow), breaker.call(ok), return_exceptions=True
+            )
+
+        first, second = asyncio.run(run())
+        self.assertEqual(first, "ok")
+        self.assertIsInstance(second, CircuitOpenError)
+
+
+if __name__ == "__main__":
+    unittest.main()
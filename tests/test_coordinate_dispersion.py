@@ -0,0 +1,58 @@
+"""
+Tests for deterministic coordinate dispersion.
+"""
+
+import os
+import random
+import sys
+import unittest
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.utils.coordinate_dispersion import (
+    _haversine_distance,
+    generate_dispersed_coordinates,
+    generate_dispersed_coordinates_batch,
+    validate_dispersed_coordinates,
+)
+
+PARIS = {"lat": 48.8566, "lon": 2.3522}
+
+
+class TestCoordinateDispersion(unittest.TestCase):
+
+    def test_deterministic(self):
+        first = generate_dispersed_coordinates("183050P6", "479", PARIS, 5.0)
+        second = generate_dispersed_coordinates("183050P6", "479", PARIS, 5.0)
+        self.assertEqual(first, second)
+
+    def test_within_radius(self):
+        for i in range(200):
+            result = generate_dispersed_coordinates(f"P{i}", "479", PARIS, 5.0)
+            self.assertTrue(validate_dispersed_coordinates(result["coordinates"], PARIS, 5.0 + 1e-6))
+
+    def test_batch_matches_single(self):
+        ids = [f"P{i}" for i in range(100)]
+        batch = generate_dispersed_coordinates_batch(ids, "479", PARIS, 5.0)
+        single = [generate_dispersed_coordinates(i, "479", PARIS, 5.0) for i in ids]
+        self.assertEqual(batch, single)
+
+    def test_validation_agrees_with_haversine(self):
+        rng = random.Random(3)
+        for _ in range(20000):
+            center = {"lat": rng.uniform(-85, 85), "lon": rng.uniform(-180, 180)}
+            radius = rng.choice([0.5, 5.0, 50.0, 300.0])
+            spread = 3 * radius / 111
+            point = {
+                "lat": center["lat"] + rng.uniform(-spread, spread),
+                "lon": center["lon"] + rng.uniform(-spread, spread),
+            }
+            exact = _haversine_distance(
+                center["lat"], center["lon"], point["lat"], point["lon"]
+            ) <= radius
+            self.assertEqual(validate_dispersed_coordinates(point, center, radius), exact)
+
+
+if __name__ == "__main__":
+    unittest.main()
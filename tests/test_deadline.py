@@ -0,0 +1,48 @@
+"""
+Tests for deadline propagation helpers in app.core.deadline.
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.deadline import call_timeout, deadline_scope, remaining
+
+
+class TestDeadline(unittest.TestCase):
+
+    def test_no_deadline_uses_default(self):
+        self.assertEqual(call_timeout(10.0), 10.0)
+        self.assertEqual(remaining(5.0), 5.0)
+
+    def test_scope_caps_timeout(self):
+        with deadline_scope(2):
+            self.assertLessEqual(call_timeout(10.0), 2)
+        self.assertEqual(call_timeout(10.0), 10.0)
+
+    def test_nested_scope_never_extends(self):
+        with deadline_scope(1):
+            with deadline_scope(60):
+                self.assertLessEqual(remaining(), 1)
+
+    def test_expired_deadline_keeps_minimum(self):
+        with deadline_scope(-1):
+            self.assertEqual(call_timeout(10.0, minimum=0.5), 0.5)
+
+    def test_propagates_to_child_tasks(self):
+        async def child():
+            return remaining()
+
+        async def run():
+            with deadline_scope(3):
+                return await asyncio.gather(child(), child())
+
+        self.assertTrue(all(r <= 3 for r in asyncio.run(run())))
+
+
+if __name__ == "__main__":
+    unittest.main()
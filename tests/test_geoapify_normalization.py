@@ -0,0 +1,100 @@
+"""
+Tests for GeoapifyClient response normalization.
+
+Exercises the _normalize_* helpers directly with canned Geoapify features.
+No network, no API key needed — pure function tests.
+"""
+
+import os
+import sys
+import unittest
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.geoapify import GeoapifyClient
+
+
+PLACE_FEATURE = {
+    "properties": {
+        "name": "Musée du Louvre",
+        "formatted": "Rue de Rivoli, 75001 Paris, France",
+        "country": "France",
+        "country_code": "fr",
+        "city": "Paris",
+        "website": "https://www.louvre.fr",
+        "contact": {"email": "info@louvre.fr"},
+        "brand_details": {"wikidata": "Q19675"},
+        "categories": ["entertainment.museum"],
+        "place_id": "abc123",
+        "datasource": {
+            "raw": {
+                "phone": "+33 1 40 20 50 50",
+                "opening_hours": "We-Mo 09:00-18:00",
+                "osm_id": 7515426,
+                "osm_type": "w",
+            }
+        },
+    },
+    "geometry": {"coordinates": [2.3376, 48.8606]},
+}
+
+
+class TestNormalizePlace(unittest.TestCase):
+
+    def setUp(self):
+        self.client = GeoapifyClient("test-key", http_client=None)
+
+    def test_extracts_core_fields(self):
+        result = self.client._normalize_place(PLACE_FEATURE)
+        self.assertEqual(result["name"], "Musée du Louvre")
+        self.assertEqual(result["location"], {"lat": 48.8606, "lng": 2.3376})
+        self.assertEqual(result["phone"], "+33 1 40 20 50 50")
+        self.assertEqual(result["email"], "info@louvre.fr")
+        self.assertEqual(result["brand_wikidata"], "Q19675")
+        self.assertEqual(result["osm_id"], 7515426)
+
+    def test_opening_hours_fall_back_to_raw(self):
+        result = self.client._normalize_place(PLACE_FEATURE)
+        self.assertEqual(result["hours"], {"weekly": None, "raw": "We-Mo 09:00-18:00"})
+
+    def test_empty_feature(self):
+        result = self.client._normalize_place({})
+        self.assertIsNone(result["name"])
+        self.assertIsNone(result["hours"])
+        self.assertEqual(result["location"], {"lat": None, "lng": None})
+        self.assertEqual(result["categories"], [])
+
+    def test_partial_coordinates(self):
+        result = self.client._normalize_place({"geometry": {"coordinates": [2.0]}})
+        self.assertEqual(result["location"], {"lat": None, "lng": 2.0})
+
+
+class TestNormalizeGeocodeAndDetails(unittest.TestCase):
+
+    def setUp(self):
+        self.client = GeoapifyClient("test-key", http_client=None)
+
+    def test_geocode_name_falls_back_to_address_line(self):
+        feature = {"properties": {"address_line1": "10 Rue X", "lat": 1.0, "lon": 2.0}}
+        result = self.client._normalize_geocode(feature)
+        self.assertEqual(result["name"], "10 Rue X")
+        self.assertEqual(result["location"], {"lat": 1.0, "lng": 2.0})
+
+    def test_details_hours_and_wiki(self):
+        feature = {
+            "properties": {
+                "opening_hours": "Mo-Su 10:00-17:00",
+                "contact": {"phone": "123"},
+                "wiki_and_media": {"wikidata": "Q1", "image": "img.jpg"},
+            }
+        }
+        result = self.client._normalize_details(feature)
+        self.assertEqual(result["hours"], {"raw": "Mo-Su 10:00-17:00"})
+        self.assertEqual(result["phone"], "123")
+        self.assertEqual(result["wikidata"], "Q1")
+        self.assertEqual(result["image"], "img.jpg")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+"""
+Tests for LocationResolver city matching.
+
+Uses an in-memory stand-in for the Motor destinations collection —
+no MongoDB needed.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import unittest
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.location_resolver import LocationResolver
+
+
+class FakeCursor:
+
+    def __init__(self, docs):
+        self.docs = docs
+
+    def limit(self, n):
+        self.docs = self.docs[:n]
+        return self
+
+    async def to_list(self, length):
+        return self.docs[:length]
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self.docs:
+            yield doc
+
+
+class FakeCollection:
+    """Supports the equality-only find() queries the resolver issues."""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.find_calls = 0
+
+    def aggregate(self, pipeline):
+        self.pipeline = pipeline
+        return FakeCursor([{"destination_id": "479", "name": "Paris", "distance_m": 2500.0}])
+
+    def find(self, query, projection=None):
+        self.find_calls += 1
+        return FakeCursor([d for d in self.docs if all(d.get(k) == v for k, v in query.items())])
+
+
+class FakeRedisCache:
+    """Dict-backed stand-in for RedisCache's get_or_set_async (JSON round-trip)."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get_or_set_async(self, prefix, params, factory, ttl_seconds=86400):
+        key = (prefix, tuple(sorted(params.items())))
+        if key in self.store:
+            return json.loads(self.store[key])
+        data = await factory()
+        if data is not None:
+            self.store[key] = json.dumps(data)
+        return data
+
+
+CITIES = [
+    {"type": "city", "country_code": "FR", "name": "Paris", "destination_id": "479"},
+    {"type": "city", "country_code": "FR", "name": "Lyon", "destination_id": "5247"},
+    {"type": "city", "country_code": "IT", "name": "Rome", "destination_id": "511"},
+]
+
+
+class TestResolveCity(unittest.TestCase):
+
+    def setUp(self):
+        self.collection = FakeCollection(CITIES)
+        self.resolver = LocationResolver(self.collection)
+
+    def test_match_is_case_insensitive(self):
+        result = asyncio.run(self.resolver.resolve_city("PARIS", "fr"))
+        self.assertEqual(result, ("479", "Paris", 100.0))
+
+    def test_falls_back_to_all_countries(self):
+        result = asyncio.run(self.resolver.resolve_city("Rome", "es"))
+        self.assertEqual(result[0], "511")
+
+    def test_no_match_below_cutoff(self):
+        self.assertIsNone(asyncio.run(self.resolver.resolve_city("Marseille", "fr")))
+
+    def test_bulk_fetches_candidates_once(self):
+        results = asyncio.run(self.resolver.resolve_cities_bulk(["lyon", "Paris", "Nice"], "FR"))
+        self.assertEqual([r and r[0] for r in results], ["5247", "479", None])
+        self.assertEqual(self.collection.find_calls, 1)
+
+    def test_candidates_cached_per_country(self):
+        asyncio.run(self.resolver.resolve_city("Paris", "FR"))
+        asyncio.run(self.resolver.resolve_city("Lyon", "fr"))
+        self.assertEqual(self.collection.find_calls, 1)
+
+    def test_resolutions_shared_through_redis(self):
+        redis = FakeRedisCache()
+        asyncio.run(LocationResolver(self.collection, redis).resolve_city("Paris", "FR"))
+        result = asyncio.run(LocationResolver(self.collection, redis).resolve_city("paris", "fr"))
+        self.assertEqual(result, ("479", "Paris", 100.0))
+
+    def test_bulk_redis_lookups_run_concurrently(self):
+        class SlowRedisCache(FakeRedisCache):
+            in_flight = peak = 0
+
+            async def get_or_set_async(self, prefix, params, factory, ttl_seconds=86400):
+                SlowRedisCache.in_flight += 1
+                SlowRedisCache.peak = max(SlowRedisCache.peak, SlowRedisCache.in_flight)
+                await asyncio.sleep(0.01)  # Redis round-trip
+                SlowRedisCache.in_flight -= 1
+                return await super().get_or_set_async(prefix, params, factory, ttl_seconds)
+
+        resolver = LocationResolver(self.collection, SlowRedisCache())
+        results = asyncio.run(resolver.resolve_cities_bulk(["Lyon", "Paris", "Nice"], "FR"))
+        self.assertEqual([r and r[0] for r in results], ["5247", "479", None])
+        self.assertEqual(SlowRedisCache.peak, 3)
+        self.assertEqual(self.collection.find_calls, 1)
+
+    def test_invalidate_reloads_candidates(self):
+        asyncio.run(self.resolver.resolve_city("Paris", "FR"))
+        self.resolver.invalidate()
+        asyncio.run(self.resolver.resolve_city("Paris", "FR"))
+        self.assertEqual(self.collection.find_calls, 2)
+
+
+
+class TestResolveGeo(unittest.TestCase):
+
+    def test_uses_server_side_distance(self):
+        collection = FakeCollection(CITIES)
+        resolver = LocationResolver(collection)
+        result = asyncio.run(resolver.resolve_geo(48.86, 2.35, radius_km=10))
+        self.assertEqual(result, ("479", "Paris", 2.5))
+        geo_near = collection.pipeline[0]["$geoNear"]
+        self.assertEqual(geo_near["near"]["coordinates"], [2.35, 48.86])
+        self.assertEqual(geo_near["maxDistance"], 10000)
+
+    def test_bulk_resolves_duplicate_points_once(self):
+        collection = FakeCollection(CITIES)
+        collection.aggregate_calls = 0
+        aggregate = collection.aggregate
+
+        def counting_aggregate(pipeline):
+            collection.aggregate_calls += 1
+            return aggregate(pipeline)
+
+        collection.aggregate = counting_aggregate
+        resolver = LocationResolver(collection)
+        points = [(48.86, 2.35), (48.86, 2.35), (45.76, 4.84)]
+        results = asyncio.run(resolver.resolve_geo_bulk(points))
+        self.assertEqual(len(results), 3)
+        self.assertEqual(collection.aggregate_calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+"""
+Tests for the client-side TokenBucket in app.core.rate_limit.
+"""
+
+import asyncio
+import os
+import sys
+import time
+import unittest
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.rate_limit import TokenBucket
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_burst_up_to_capacity_is_immediate(self):
+        async def run():
+            bucket = TokenBucket(rate=100)
+            start = time.monotonic()
+            for _ in range(100):
+                await bucket.acquire()
+            return time.monotonic() - start
+
+        self.assertLess(asyncio.run(run()), 0.05)
+
+    def test_waits_once_empty(self):
+        async def run():
+            bucket = TokenBucket(rate=50, capacity=1)
+            start = time.monotonic()
+            for _ in range(6):
+                async with bucket:
+                    pass
+            return time.monotonic() - start
+
+        # 1 banked token, then 5 more at 50/s
+        self.assertGreaterEqual(asyncio.run(run()), 0.09)
+
+    def test_drain_forces_wait(self):
+        async def run():
+            bucket = TokenBucket(rate=20)
+            bucket.drain()
+            start = time.monotonic()
+            await bucket.acquire()
+            return time.monotonic() - start
+
+        self.assertGreaterEqual(asyncio.run(run()), 0.04)
+
+
+if __name__ == "__main__":
+    unittest.main()
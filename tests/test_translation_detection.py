@@ -0,0 +1,45 @@
+"""
+Tests for TranslationClient's French/English detection heuristics.
+
+Pure string classification — no translation service needed.
+"""
+
+import os
+import sys
+import unittest
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.translation import TranslationClient
+
+
+class TestIsFrench(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TranslationClient("http://localhost", http_client=None)
+
+    def test_diacritics_are_french(self):
+        self.assertTrue(self.client.is_french("Musée d'Orsay"))
+        self.assertTrue(self.client.is_french("ÉGLISE SAINT-SULPICE"))
+
+    def test_french_words_outnumber_english(self):
+        self.assertTrue(self.client.is_french("Tour de la Ville"))
+
+    def test_english_name(self):
+        self.assertFalse(self.client.is_french("Tower of London"))
+
+    def test_tie_broken_by_french_article(self):
+        # "tour" (FR) vs "place" (EN), with the article "la"
+        self.assertTrue(self.client.is_french("Tour la Place"))
+
+    def test_unknown_or_empty(self):
+        self.assertFalse(self.client.is_french("Colosseum"))
+        self.assertFalse(self.client.is_french("   "))
+
+    def test_count_indicators(self):
+        self.assertEqual(self.client._count_indicators("Palace of the Louvre"), (3, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
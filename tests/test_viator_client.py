@@ -0,0 +1,221 @@
+"""
+Tests for ViatorClient's GET response cache.
+
+The HTTP layer is replaced by a counting stub on ``request`` so no network
+or API key is needed.
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+from concurrent.futures import Future
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.viator.client import (
+    BulkCoalescer,
+    ViatorAPIError,
+    ViatorClient,
+    ViatorRateLimitError,
+    _parse_retry_after,
+    _retry_wait,
+)
+
+
+class CountingViatorClient(ViatorClient):
+    """ViatorClient whose request() records calls instead of hitting the API."""
+
+    def __init__(self):
+        super().__init__(api_key="test", http_client=object())
+        self.calls = []
+
+    async def request(self, method, endpoint, params=None, json_data=None, language="en"):
+        self.calls.append((method, endpoint, params, language))
+        await asyncio.sleep(0)
+        return {"endpoint": endpoint, "params": params, "language": language}
+
+
+class TestViatorResponseCache(unittest.TestCase):
+
+    def test_product_details_cached(self):
+        client = CountingViatorClient()
+
+        async def run():
+            first = await client.get("/partner/products/P1", language="en")
+            second = await client.get("/partner/products/P1", language="en")
+            return first, second
+
+        first, second = asyncio.run(run())
+        self.assertEqual(first, second)
+        self.assertEqual(len(client.calls), 1)
+
+    def test_key_includes_params_and_language(self):
+        client = CountingViatorClient()
+
+        async def run():
+            await client.get("/partner/locations/L1", params={"a": 1, "b": 2})
+            await client.get("/partner/locations/L1", params={"b": 2, "a": 1})
+            await client.get("/partner/locations/L1", params={"a": 2})
+            await client.get("/partner/locations/L1", params={"a": 1, "b": 2}, language="fr")
+
+        asyncio.run(run())
+        self.assertEqual(len(client.calls), 3)
+
+    def test_concurrent_misses_share_one_request(self):
+        client = CountingViatorClient()
+
+        async def run():
+            return await asyncio.gather(
+                *(client.get("/partner/products/P1") for _ in range(5))
+            )
+
+        results = asyncio.run(run())
+        self.assertEqual(len(client.calls), 1)
+        self.assertTrue(all(r == results[0] for r in results))
+
+    def test_sync_endpoints_not_cached(self):
+        client = CountingViatorClient()
+
+        async def run():
+            for _ in range(2):
+                await client.get("/partner/destinations", params={})
+                await client.get("/partner/products/tags")
+
+        asyncio.run(run())
+        self.assertEqual(len(client.calls), 4)
+
+    def test_post_not_cached(self):
+        client = CountingViatorClient()
+
+        async def run():
+            for _ in range(2):
+                await client.post("/partner/products/search", json_data={"q": 1})
+
+        asyncio.run(run())
+        self.assertEqual(len(client.calls), 2)
+
+    def test_clear_response_cache(self):
+        client = CountingViatorClient()
+
+        async def run():
+            await client.get("/partner/products/P1")
+            client.clear_response_cache()
+            await client.get("/partner/products/P1")
+
+        asyncio.run(run())
+        self.assertEqual(len(client.calls), 2)
+
+
+class TestBulkCoalescer(unittest.TestCase):
+
+    def test_concurrent_submits_share_one_bulk_call(self):
+        batches = []
+
+        async def fetch_bulk(keys):
+            batches.append(keys)
+            return [{"ref": key, "value": key.upper()} for key in keys]
+
+        async def run():
+            coalescer = BulkCoalescer(fetch_bulk, key_field="ref")
+            return await asyncio.gather(*(coalescer.submit(k) for k in ["a", "b", "a", "c"]))
+
+        results = asyncio.run(run())
+        self.assertEqual([r["value"] for r in results], ["A", "B", "A", "C"])
+        self.assertEqual(batches, [["a", "b", "c"]])
+
+    def test_full_batch_flushes_early(self):
+        batches = []
+
+        async def fetch_bulk(keys):
+            batches.append(keys)
+            return [{"ref": key} for key in keys]
+
+        async def run():
+            coalescer = BulkCoalescer(fetch_bulk, key_field="ref", batch_size=2, flush_seconds=60)
+            await asyncio.gather(*(coalescer.submit(k) for k in ["a", "b", "c", "d"]))
+
+        asyncio.run(run())
+        self.assertEqual(batches, [["a", "b"], ["c", "d"]])
+
+    def test_missing_item_and_errors_propagate(self):
+        async def partial(keys):
+            return [{"ref": "a"}]
+
+        async def failing(keys):
+            raise ViatorAPIError("boom")
+
+        async def run(fetch_bulk):
+            coalescer = BulkCoalescer(fetch_bulk, key_field="ref")
+            return await asyncio.gather(
+                coalescer.submit("a"), coalescer.submit("b"), return_exceptions=True
+            )
+
+        ok, missing = asyncio.run(run(partial))
+        self.assertEqual(ok, {"ref": "a"})
+        self.assertIsInstance(missing, ViatorAPIError)
+        self.assertTrue(all(isinstance(r, ViatorAPIError) for r in asyncio.run(run(failing))))
+
+    def test_location_details_batched_and_cached(self):
+        client = CountingViatorClient()
+
+        async def get_bulk_locations(refs):
+            client.calls.append(("POST", "/partner/locations/bulk", refs, "en"))
+            return [{"reference": ref} for ref in refs]
+
+        client._location_coalescer.fetch_bulk = get_bulk_locations
+
+        async def run():
+            await asyncio.gather(*(client.get_location_details(r) for r in ["L1", "L2"]))
+            return await client.get_location_details("L1")
+
+        self.assertEqual(asyncio.run(run()), {"reference": "L1"})
+        self.assertEqual(len(client.calls), 1)
+
+    def test_bulk_locations_deduplicated_and_chunked(self):
+        client = CountingViatorClient()
+        client.MAX_BULK_LOCATIONS = 2
+
+        async def post(endpoint, json_data=None, language="en"):
+            refs = json_data["locations"]
+            client.calls.append(("POST", endpoint, refs, language))
+            await asyncio.sleep(0)
+            return {"locations": [{"reference": ref} for ref in refs]}
+
+        client.post = post
+
+        locations = asyncio.run(client.get_bulk_locations(["L1", "L2", "L1", "L3"]))
+        self.assertEqual([loc["reference"] for loc in locations], ["L1", "L2", "L3"])
+        self.assertEqual([call[2] for call in client.calls], [["L1", "L2"], ["L3"]])
+
+
+class FakeRetryState:
+    """Just enough of tenacity's RetryCallState for the wait strategy."""
+
+    def __init__(self, attempt_number, error):
+        self.attempt_number = attempt_number
+        future = Future()
+        future.set_exception(error)
+        self.outcome = future
+
+
+class TestViatorRetryWait(unittest.TestCase):
+
+    def test_parse_retry_after(self):
+        self.assertEqual(_parse_retry_after("7"), 7.0)
+        self.assertIsNone(_parse_retry_after(None))
+        self.assertIsNone(_parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"))
+
+    def test_wait_honours_retry_after(self):
+        state = FakeRetryState(1, ViatorRateLimitError("429", retry_after=12.0))
+        self.assertGreaterEqual(_retry_wait(state), 12.0)
+
+    def test_wait_is_capped_jittered_backoff_without_hint(self):
+        for attempt in range(1, 6):
+            state = FakeRetryState(attempt, ViatorRateLimitError("429"))
+            self.assertLessEqual(_retry_wait(state), 30.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
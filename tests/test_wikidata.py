@@ -0,0 +1,126 @@
+"""
+Tests for WikidataClient query rendering and strategy ordering.
+
+SPARQL calls are replaced by a dict lookup keyed on the rendered query, so
+no network access is needed.
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.wikidata import (
+    SPARQL_TEMPLATE,
+    SPARQL_TEMPLATE_FR,
+    SPARQL_TEMPLATE_FUZZY,
+    WikidataClient,
+    _render,
+)
+
+
+class StubWikidataClient(WikidataClient):
+    """WikidataClient answering SPARQL queries from a dict."""
+
+    def __init__(self, answers):
+        super().__init__("test-agent", object())
+        self.answers = answers
+        self.queries = []
+
+    async def _run_query(self, query):
+        self.queries.append(query)
+        await asyncio.sleep(0)
+        return self.answers.get(query)
+
+
+class TestRender(unittest.TestCase):
+
+    def test_quotes_and_backslashes_escaped(self):
+        rendered = _render('?item rdfs:label "%s"@en.', 'Say "hi" \\ bye')
+        self.assertEqual(rendered, '?item rdfs:label "Say \\"hi\\" \\\\ bye"@en.')
+
+    def test_apostrophes_untouched(self):
+        self.assertIn('"Jeanne d\'Arc"@en', _render(SPARQL_TEMPLATE, "Jeanne d'Arc"))
+
+    def test_templates_are_stripped(self):
+        for template in (SPARQL_TEMPLATE, SPARQL_TEMPLATE_FR, SPARQL_TEMPLATE_FUZZY):
+            self.assertEqual(template, template.strip())
+
+
+class TestFetchStrategies(unittest.TestCase):
+    poi, city = "Tour Eiffel", "Paris"
+
+    def queries(self):
+        return (
+            _render(SPARQL_TEMPLATE, self.poi),
+            _render(SPARQL_TEMPLATE_FR, self.poi),
+            _render(SPARQL_TEMPLATE, f"{self.poi} ({self.city})"),
+            _render(SPARQL_TEMPLATE_FUZZY, self.poi),
+        )
+
+    def test_priority_order_kept(self):
+        exact, french, with_city, _ = self.queries()
+        client = StubWikidataClient({
+            exact: {"description": None},
+            french: {"description": "french"},
+            with_city: {"description": "with city"},
+        })
+        self.assertEqual(asyncio.run(client.fetch(self.poi, self.city)), {"description": "french"})
+
+    def test_no_description_result_skips_fuzzy(self):
+        _, french, _, fuzzy = self.queries()
+        client = StubWikidataClient({french: {"description": None, "x": 1}})
+        self.assertEqual(asyncio.run(client.fetch(self.poi, self.city)), {"description": None, "x": 1})
+        self.assertNotIn(fuzzy, client.queries)
+
+    def test_fuzzy_only_when_first_three_find_nothing(self):
+        fuzzy = self.queries()[3]
+        client = StubWikidataClient({fuzzy: {"description": "fuzzy"}})
+        self.assertEqual(asyncio.run(client.fetch(self.poi, self.city)), {"description": "fuzzy"})
+        self.assertEqual(client.queries[-1], fuzzy)
+
+    def test_concurrent_duplicates_share_queries(self):
+        exact = self.queries()[0]
+        client = StubWikidataClient({exact: {"description": "en"}})
+
+        async def run():
+            return await asyncio.gather(*(client.fetch(self.poi, self.city) for _ in range(4)))
+
+        results = asyncio.run(run())
+        self.assertTrue(all(r == {"description": "en"} for r in results))
+        self.assertLessEqual(len(client.queries), 3)
+
+    def test_losing_strategies_cancelled(self):
+        exact, french, with_city, _ = self.queries()
+        started, cancelled = [], []
+
+        class SlowLosersClient(StubWikidataClient):
+            async def _run_query(self, query):
+                started.append(query)
+                if query == exact:
+                    return {"description": "en"}
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(query)
+                    raise
+
+        client = SlowLosersClient({})
+
+        async def run():
+            result = await client.fetch(self.poi, self.city)
+            await asyncio.sleep(0)  # let the cancellations land
+            # Checked inside the loop: asyncio.run cancels leftovers on exit
+            return result, list(cancelled)
+
+        result, cancelled_before_exit = asyncio.run(run())
+        self.assertEqual(result, {"description": "en"})
+        self.assertEqual(len(started), 3)
+        self.assertCountEqual(cancelled_before_exit, [french, with_city])
+
+
+if __name__ == "__main__":
+    unittest.main()